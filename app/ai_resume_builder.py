@@ -1,446 +1,185 @@
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import asyncio
 import os
 from dotenv import load_dotenv
-from pydantic_ai import Agent
 
+from app import prompts
+from app.config import (
+    BACKGROUND_PARSER_VERSION, BATCH_MAX_CONCURRENCY,
+    GENERATION_MAX_CONCURRENCY, GENERATION_MODE, LLM_CACHE_ENABLED, LLM_MODEL,
+    LLM_PROVIDER, NEAR_DUPLICATE_DETECTION, OFFLINE_LATENCY_SECONDS, SECTION_PROMPT_VERSION,
+    SECTION_TOKEN_BUDGETS
+)
+from app.db.background_repository import BackgroundRepository
 from app.db.company_repository import CompanyRepository
+from app.db.profile_repository import ProfileRepository
 from app.db.repository import ResumeRepository
+from app.hashing import content_hash
+from app.instrumentation import (
+    current_report, record_usage, recording, summarize_reports, track_stage
+)
+from app.llm_cache import CachedAgent, LLMCache
+from app.llm_scheduler import LLMScheduler, ScheduledAgent, get_scheduler
+from app.near_duplicates import NearDuplicateIndex
+from app.single_flight import SingleFlight
+from app.skill_index import SkillIndex
+from app.offline_model import OFFLINE_MODEL_NAME, OfflineAgent
+from app.prompt_compaction import compact_job_description
 from app.models import (
     JobAnalysis, ParsedBackground, GeneratedSummary,
     GeneratedSkills, GeneratedExperience, GeneratedEducation,
-    GeneratedProjects, Skill, SkillCategory, Experience,
-    Education, Project, Company
+    GeneratedProjects, GeneratedResume, Skill, SkillCategory, Experience,
+    Education, Project, Company, Job, ResumeBatchResult,
+    ResumeReport, BatchReport, ResumeEvent, SkillMatch
 )
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Resume sections produced by the section generators, in the order they are stored
+RESUME_SECTIONS = ("summary", "skills", "experience", "education", "projects")
+
+# Sections whose generation is checkpointed: the personal info copied from the
+# background, then the generated sections
+CHECKPOINT_SECTIONS = ("personal_info",) + RESUME_SECTIONS
+
+# Ways of generating the sections; see config.GENERATION_MODE
+GENERATION_MODES = ("per-section", "compact")
+
 class AIResumeBuilder:
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, max_concurrency: int = GENERATION_MAX_CONCURRENCY,
+                 llm_cache: Optional[LLMCache] = None,
+                 use_llm_cache: bool = LLM_CACHE_ENABLED,
+                 section_token_budgets: Optional[Dict[str, Optional[int]]] = None,
+                 provider: str = LLM_PROVIDER,
+                 scheduler: Optional[LLMScheduler] = None,
+                 detect_duplicates: bool = NEAR_DUPLICATE_DETECTION):
+        if provider not in ("openai", "offline"):
+            raise ValueError(f"Unknown LLM provider: {provider}")
         self.db_path = db_path
+        self.max_concurrency = max_concurrency
+        self.provider = provider
+        self.model = LLM_MODEL if provider == "openai" else OFFLINE_MODEL_NAME
+        self.section_token_budgets = (
+            SECTION_TOKEN_BUDGETS if section_token_budgets is None else section_token_budgets
+        )
+        if llm_cache is None and use_llm_cache:
+            llm_cache = LLMCache(db_path)
+        self.llm_cache = llm_cache if use_llm_cache else None
+        self.scheduler = scheduler or get_scheduler()
         self.company_repo = CompanyRepository(db_path)
         self.resume_repo = ResumeRepository(db_path)
-        
-        # Initialize AI agents
-        self.job_analyzer = Agent(
-            'openai:gpt-4o-mini',
-            output_type=JobAnalysis,
-            system_prompt="""
-            You are an expert job description analyzer. Extract and categorize key information with a focus on identifying essential requirements and keywords.
-            
-            Your output MUST include ALL of these fields:
-            - company_name: Name of the hiring company
-            - about: Brief description of the company and role context
-            - required_education: Educational qualifications, certifications, etc.
-            - required_experience: Years of experience and specific domain expertise needed
-            - required_skills: Both technical and soft skills needed for the role
-            - job_description: The complete original job description text
-
-            Key Analysis Rules:
-            1. Extract and categorize ALL technical skills mentioned:
-               - Programming languages (e.g., Python, Java)
-               - Frameworks & libraries (e.g., PyTorch, React)
-               - Tools & platforms (e.g., AWS, Docker)
-               - Domain knowledge (e.g., ML, NLP)
-               
-            2. Identify required experience levels:
-               - Years of experience for each skill/domain
-               - Leadership/management requirements
-               - Industry-specific experience
-               
-            3. Determine education requirements:
-               - Minimum degree level
-               - Preferred/alternative qualifications
-               - Required certifications
-               
-            4. Extract key responsibilities:
-               - Core technical tasks
-               - Project management duties
-               - Team collaboration aspects
-               
-            5. Identify priority skills:
-               - Must-have vs nice-to-have skills
-               - Core technologies vs optional ones
-               - Required vs preferred experience
-
-            Important Rules:
-            1. All fields are required - do not omit any field
-            2. Keep descriptions concise but comprehensive
-            3. Preserve ALL technical terms and metrics exactly as written
-            4. Include both explicit and implicit requirements
-            5. Maintain all specific tools, frameworks, and methodologies mentioned
-            6. Tag skills as [REQUIRED] or [PREFERRED] based on context
-            """
-        )
-        
-        self.background_parser = Agent(
-            'openai:gpt-4o-mini',
-            output_type=ParsedBackground,
-            system_prompt="""
-            You are an expert resume parser. Parse the input text into a strict format with these required fields:
-
-            {
-                "personal_info": {
-                    "name": "Full name",
-                    "headline": "Current role title",
-                    "contact_details": [
-                        {
-                            "detail_name": "Email/Phone/LinkedIn/GitHub/Website",
-                            "detail_icon": "Font Awesome icon (fas/fab)",
-                            "detail_info": "Actual contact information"
-                        }
-                    ]
-                },
-                "work_history": [
-                    {
-                        "title": "Job title",
-                        "company": "Company name",
-                        "date_range": "Date range",
-                        "location": "Location",
-                        "key_responsibilities": [
-                            "List of main responsibilities and achievements"
-                        ]
-                    }
-                ],
-                "education_history": [
-                    {
-                        "degree": "Degree name",
-                        "institution": "Institution name",
-                        "date_range": "Date range",
-                        "location": "Location",
-                        "description": "Brief description of achievements"
-                    }
-                ],
-                "skills_list": [
-                    "List of all skills mentioned"
-                ],
-                "project_history": [
-                    {
-                        "title": "Project name",
-                        "technologies": "Technologies used",
-                        "description": "Project description",
-                        "link": "Project link (if any)"
-                    }
-                ]
-            }
-
-            Important Rules:
-            1. ALL fields are REQUIRED - do not omit any section
-            2. Contact details must use Font Awesome icons:
-               - Email: fas fa-envelope
-               - Phone: fas fa-phone
-               - LinkedIn: fab fa-linkedin
-               - GitHub: fab fa-github
-               - Website: fas fa-globe
-            3. Extract ALL skills mentioned in work/projects
-            4. Keep original metrics and numbers
-            5. Include ALL projects mentioned
-            6. Use exact dates as provided
-            7. Keep descriptions clear and concise
-            """
-        )
-        
-        # Initialize section-specific agents
-        self.summary_generator = Agent(
-            'openai:gpt-4o-mini',
-            output_type=GeneratedSummary,
-            system_prompt="""
-            You are an expert resume writer focusing on professional summaries.
-            Create a focused, achievement-oriented summary that:
-
-            1. Matches Job Requirements:
-               - Lead with experience most relevant to role
-               - Highlight exact skills from requirements
-               - Focus on required years of experience
-               - Emphasize domain expertise match
-
-            2. Emphasizes Key Achievements:
-               - Include top 2-3 relevant metrics
-               - Focus on business impact
-               - Highlight scale/scope of work
-               - Mention key technologies
-
-            3. Shows Leadership & Growth:
-               - Note team/project leadership
-               - Highlight cross-functional work
-               - Show career progression
-               - Emphasize key responsibilities
-
-            4. Demonstrates Technical Depth:
-               - Focus on complex challenges solved
-               - Mention advanced technical skills
-               - Note innovative solutions
-               - Highlight major projects
-
-            Format Rules:
-            1. Length: 2-4 impactful sentences
-            2. Structure: Experience → Skills → Achievements
-            3. Focus: Target role requirements
-            4. Style: Active voice, quantifiable results
-            5. Emphasis: Technical expertise and outcomes
-
-            Avoid:
-            - Generic statements
-            - Non-relevant experience
-            - Soft skills without context
-            - Excessive length
-            """
-        )
-        
-        self.skills_generator = Agent(
-            'openai:gpt-4o-mini',
-            output_type=GeneratedSkills,
-            system_prompt="""
-            You are an expert in organizing and matching professional skills.
-            Create a skills section that strictly follows this JSON structure and MUST include ALL categories:
-            {
-                "categories": [
-                    {
-                        "name": "Core Technical",
-                        "skills": [ list of technical skills ]
-                    },
-                    {
-                        "name": "Tools & Platforms",
-                        "skills": [ list of tools/platforms ]
-                    },
-                    {
-                        "name": "Domain Expertise",
-                        "skills": [ list of domain skills ]
-                    },
-                    {
-                        "name": "Methodologies",
-                        "skills": [ list of methodologies ]
-                    },
-                    {
-                        "name": "Soft Skills",
-                        "skills": [ list of soft skills ]
-                    }
-                ]
-            }
-
-            Required Categories (ALL must be included):
-            1. "Core Technical":
-               - Programming languages
-               - Frameworks
-               - Libraries
-               - Core technologies
-
-            2. "Tools & Platforms":
-               - Development tools
-               - Cloud platforms
-               - Databases
-               - Infrastructure
-               - Development environments
-
-            3. "Domain Expertise":
-               - Industry knowledge
-               - Business domains
-               - Specialized fields
-               - Technical domains
-
-            4. "Methodologies":
-               - Development methodologies
-               - Project management approaches
-               - Best practices
-               - Standards and processes
-
-            5. "Soft Skills":
-               - Leadership abilities
-               - Communication skills
-               - Problem-solving approaches
-               - Team collaboration
-
-            Skill Scoring Rules:
-            Score each skill 0-100 based on:
-            - Years of experience (10pts/year)
-            - Project complexity (up to 20pts)
-            - Leadership role (up to 10pts)
-            - Recent usage (up to 10pts)
-
-            Important Requirements:
-            1. ALL five categories must be included, even if some have fewer skills
-            2. Each skill must have a name and proficiency score
-            3. Include both exact requirement matches and related skills
-            4. Use precise technical terminology
-            5. Include skills from background even if not in requirements
-            6. Organize similar technologies together within categories
-            """
-        )
-        
-        self.experience_generator = Agent(
-            'openai:gpt-4o-mini',
-            output_type=GeneratedExperience,
-            system_prompt="""
-            You are an expert in crafting targeted professional experience sections.
-            Create highly relevant experience entries that:
-
-            1. Experience Selection Strategy:
-               For each position, assess:
-               - Direct skill matches to requirements
-               - Domain/industry relevance
-               - Project complexity alignment
-               - Leadership level fit
-               - Technical depth match
-
-            2. Content Prioritization:
-               For each bullet point:
-               - Lead with most relevant achievements
-               - Focus on required technologies
-               - Highlight matching methodologies
-               - Emphasize scale/scope alignment
-               - Include key metrics and outcomes
-
-            3. Achievement Format Rules:
-               Structure: Action Verb → Technology → Impact → Metric
-               Example: "Architected Python microservices reducing latency by 40%"
-               
-               Focus on:
-               - Technical implementation details
-               - Scale of impact
-               - Team/project leadership
-               - Business outcomes
-               - Innovation/problem-solving
-
-            4. Chronological Ordering:
-               - Most recent first (display_order = 0)
-               - Increment display_order for older roles
-               - Maintain exact original order
-               - Keep all positions from input
-
-            5. Content Selection Criteria:
-               Include experiences that show:
-               - Required technical skills
-               - Similar project scope
-               - Relevant domain expertise
-               - Leadership capabilities
-               - Problem-solving approach
-
-            Important Guidelines:
-            1. Use exact technical terms
-            2. Keep each bullet 1-2 lines
-            3. Start with strong action verbs
-            4. Include specific metrics
-            5. Show progression/growth
-            6. Focus on achievements over duties
-            """
-        )
-        
-        self.education_generator = Agent(
-            'openai:gpt-4o-mini',
-            output_type=GeneratedEducation,
-            system_prompt="""
-            You are an expert in presenting educational qualifications strategically.
-            Create targeted education entries that maximize keyword relevance.
-
-            Structure Requirements:
-            1. Each education entry MUST include:
-               - Degree name and field
-               - Institution name
-               - Location
-               - Date range
-               - Detailed description with AT LEAST two bullet points
-
-            2. Description Format:
-               First Point: Academic Achievement
-               - Focus on coursework and technical skills
-               - Include relevant technologies and tools
-               - Mention specialized training
-               - Add quantifiable metrics
-               Example: "Specialized in ML/AI with advanced coursework in Neural Networks, NLP, and Computer Vision; achieved 4.0 GPA in core technical subjects and published 2 research papers"
-
-               Second Point: Projects and Leadership
-               - Highlight technical projects
-               - Show leadership roles
-               - Mention industry collaboration
-               - Include research work
-               Example: "Led a 5-person team developing a deep learning model for medical imaging, achieving 95% accuracy; served as Teaching Assistant for Advanced ML course, mentoring 50+ students"
-
-            3. Content Requirements:
-               - Include ALL relevant technical keywords
-               - Highlight skills not mentioned in experience
-               - Show theoretical knowledge depth
-               - Demonstrate practical application
-               - Include quantifiable achievements
-
-            4. Keyword Integration:
-               - Add relevant technical terms
-               - Include methodologies studied
-               - Mention tools and frameworks
-               - List specialized training
-               - Note certifications and awards
-
-            Important Guidelines:
-            1. Each description MUST have at least 2 detailed points
-            2. Focus on technical and quantifiable achievements
-            3. Include keywords missing from other sections
-            4. Show both theoretical knowledge and practical application
-            5. Highlight research and projects relevant to the job
-            6. Include leadership and teaching experience if any
-            """
-        )
-        
-        self.projects_generator = Agent(
-            'openai:gpt-4o-mini',
-            output_type=GeneratedProjects,
-            system_prompt="""
-            You are an expert in showcasing technical projects strategically.
-            Create detailed project descriptions that highlight technical depth and impact.
-
-            Structure Requirements:
-            1. Each project MUST include:
-               - Project title
-               - Technologies used
-               - Project link (if available)
-               - TWO detailed description points
-
-            2. First Description Point - Technical Implementation:
-               Format: "Developed/Built/Implemented [specific technical solution] using [technologies] for [purpose]"
-               Example: "Developed a distributed machine learning pipeline using PyTorch and Ray for processing 1M+ documents daily"
-               Focus on:
-               - Architecture decisions
-               - Technical challenges solved
-               - Implementation details
-               - Scale and complexity
-
-            3. Second Description Point - Impact and Innovation:
-               Format: "Achieved [specific outcome] resulting in [business impact] through [technical approach]"
-               Example: "Achieved 95% accuracy in document classification by implementing custom BERT model with active learning"
-               Include:
-               - Performance improvements
-               - Business impact
-               - Innovation aspects
-               - Metrics and scale
-
-            4. Technology Integration:
-               For each project, include:
-               - Core technologies
-               - Frameworks and libraries
-               - Infrastructure/platforms
-               - Development tools
-               - Methodologies used
-
-            5. Project Selection Priority:
-               Order projects by:
-               - Relevance to job requirements
-               - Technical complexity
-               - Business impact
-               - Recent completion
-               - Innovation level
-
-            Critical Requirements:
-            1. MUST have TWO detailed points per project
-            2. Include specific technical details
-            3. Show end-to-end implementation
-            4. Include quantifiable metrics
-            5. Demonstrate problem-solving approach
-            6. Highlight unique technical challenges
-            7. Include keywords missing from other sections
-
-            Remember: Use projects to showcase skills and technologies 
-            not prominently featured in work experience
-            """
-        )
+        self.background_repo = BackgroundRepository(db_path)
+        self.profile_repo = ProfileRepository(db_path)
+        self.near_duplicates = NearDuplicateIndex(db_path) if detect_duplicates else None
+        self.skill_index = SkillIndex(db_path)
+
+        # Parsed backgrounds keyed by content hash, shared by every resume
+        # built with this instance
+        self._parsed_backgrounds: Dict[str, ParsedBackground] = {}
+
+        # Stored profile IDs keyed by profile version hash
+        self._profile_ids: Dict[str, int] = {}
+
+        # Concurrent analyses and background parses of the same input share one call
+        self._single_flight = SingleFlight()
+
+        # Latest per-stage instrumentation report for each job ID
+        self.reports: Dict[str, ResumeReport] = {}
+
+    # Agents are built on first use, so commands that never call the LLM do
+    # not pay for importing and configuring them
+
+    @cached_property
+    def job_analyzer(self):
+        """Agent extracting a JobAnalysis from a job description."""
+        return self._build_agent(output_type=JobAnalysis, system_prompt=prompts.JOB_ANALYZER_PROMPT)
+
+    @cached_property
+    def background_parser(self):
+        """Agent parsing the free-text background into a ParsedBackground."""
+        return self._build_agent(output_type=ParsedBackground, system_prompt=prompts.BACKGROUND_PARSER_PROMPT)
+
+    @cached_property
+    def summary_generator(self):
+        """Agent writing the professional summary."""
+        return self._build_agent(output_type=GeneratedSummary, system_prompt=prompts.SUMMARY_GENERATOR_PROMPT)
+
+    @cached_property
+    def skills_generator(self):
+        """Agent selecting and scoring skills by category."""
+        return self._build_agent(output_type=GeneratedSkills, system_prompt=prompts.SKILLS_GENERATOR_PROMPT)
+
+    @cached_property
+    def experience_generator(self):
+        """Agent writing the work experience entries."""
+        return self._build_agent(output_type=GeneratedExperience, system_prompt=prompts.EXPERIENCE_GENERATOR_PROMPT)
+
+    @cached_property
+    def education_generator(self):
+        """Agent writing the education entries."""
+        return self._build_agent(output_type=GeneratedEducation, system_prompt=prompts.EDUCATION_GENERATOR_PROMPT)
+
+    @cached_property
+    def projects_generator(self):
+        """Agent writing the project entries."""
+        return self._build_agent(output_type=GeneratedProjects, system_prompt=prompts.PROJECTS_GENERATOR_PROMPT)
+
+    @cached_property
+    def resume_generator(self):
+        """Agent writing every section in one call (compact generation mode)."""
+        return self._build_agent(output_type=GeneratedResume, system_prompt=prompts.RESUME_GENERATOR_PROMPT)
+
+    def _build_agent(self, output_type: type, system_prompt: str):
+        """
+        Create an agent for the configured provider. Model calls go through
+        the shared request scheduler; cache hits in front of it skip the
+        scheduler entirely.
+        """
+        if self.provider == "offline":
+            agent = OfflineAgent(output_type, system_prompt, latency=OFFLINE_LATENCY_SECONDS)
+        else:
+            # pydantic-ai (and the OpenAI client under it) is slow to import;
+            # only pay for it once a real model is needed
+            from pydantic_ai import Agent
+            agent = Agent(self.model, output_type=output_type, system_prompt=system_prompt)
+        agent = ScheduledAgent(agent, self.scheduler, system_prompt)
+        if self.llm_cache is None:
+            return agent
+        return CachedAgent(agent, self.llm_cache, self.model, system_prompt, output_type)
+
+    async def _run_agent(self, agent, user_prompt: Any):
+        """Run an agent and record its token usage against the active stage."""
+        result = await agent.run(user_prompt)
+        record_usage(result)
+        return result
+
+    async def _resume_db(self, call: Callable, *args: Any, write: bool = False, **kwargs: Any) -> Any:
+        """Run a blocking ResumeRepository call on a database thread, off the event loop."""
+        return await self.resume_repo.connections.run(call, *args, write=write, **kwargs)
+
+    @contextmanager
+    def _reporting(self, job_id: Optional[str]) -> Iterator[Optional[ResumeReport]]:
+        """
+        Record stages into the report that is already active (e.g. the batch's
+        report for this job), or else into self.reports[job_id].
+        """
+        report = current_report()
+        if report is not None or job_id is None:
+            yield report
+            return
+        report = self.reports.setdefault(job_id, ResumeReport(job_id=job_id))
+        with recording(report):
+            yield report
+
+    def batch_report(self, job_ids: Optional[Iterable[str]] = None) -> BatchReport:
+        """Aggregate the reports of the given jobs (default: all) into p50/p95 per stage."""
+        if job_ids is None:
+            return summarize_reports(self.reports.values())
+        return summarize_reports(self.reports[job_id] for job_id in job_ids if job_id in self.reports)
 
     async def analyze_job_description(self, job_description: str) -> int:
         """Analyze job description and store in database."""
@@ -458,133 +197,578 @@ class AIResumeBuilder:
         }
         return self.company_repo.add_company(company_data)
 
-    async def analyze_job_description_with_company(self, company: Company) -> int:
+    async def analyze_job_description_with_company(self, company: Company, job_id: Optional[str] = None) -> int:
         """
         Analyze a job description and save the analysis to the database.
 
+        When job_id is given the analysis is stored against the job and a hash
+        of its description, and an existing analysis for the same pair is
+        returned without calling the analyzer or adding another company row.
+        Concurrent calls for the same job and description share one analysis.
+
         Args:
             company: Company object containing job details
+            job_id: ID of the job in the jobs table, if it has one
             
         Returns:
             int: The company ID in the database
         """
+        key = ("analysis", job_id, content_hash(
+            company.name, company.job_title, company.job_description
+        ))
         try:
-            # Analyze the job description using OpenAI
-            result = await self.job_analyzer.run({"job_description": company.job_description})
-            
-            # Update company with analysis results
-            # Only update fields if they are returned in the analysis
-            if hasattr(result.output, 'about'):
-                company.about = result.output.about
-            if hasattr(result.output, 'required_education'):
-                company.required_education = result.output.required_education
-            if hasattr(result.output, 'required_experience'):
-                company.required_experience = result.output.required_experience
-            if hasattr(result.output, 'required_skills'):
-                company.required_skills = result.output.required_skills
-            if hasattr(result.output, 'company_name') and not company.name:
-                company.name = result.output.company_name
-            
-            # Save to database
-            company_id = await self.company_repo.create(company)
-            return company_id
-            
+            with self._reporting(job_id):
+                return await self._single_flight.do(
+                    key, lambda: self._analyze_job_description_with_company(company, job_id)
+                )
         except Exception as e:
             print(f"Error analyzing job description: {str(e)}")
             raise
 
-    async def create_resume(self, company_id: int, my_background: str, job_id: str) -> int:
-        """Create a targeted resume based on job requirements."""
-        # Get company information
-        company_data = self.company_repo.get_company(company_id)
-        if not company_data:
-            raise ValueError("Company not found")
+    async def _analyze_job_description_with_company(self, company: Company, job_id: Optional[str]) -> int:
+        """Look up or run the job analysis, timing each stage."""
+        description_hash = content_hash(company.job_description)
+        if job_id is not None:
+            with track_stage("analysis_lookup"):
+                company_id = await self.company_repo.get_by_job(job_id, description_hash)
+            if company_id is not None:
+                return company_id
+
+        # Analyze the job description using OpenAI
+        with track_stage("analyze_job"):
+            result = await self._run_agent(self.job_analyzer, {"job_description": company.job_description})
+        
+        # Update company with analysis results
+        # Only update fields if they are returned in the analysis
+        if hasattr(result.output, 'about'):
+            company.about = result.output.about
+        if hasattr(result.output, 'required_education'):
+            company.required_education = result.output.required_education
+        if hasattr(result.output, 'required_experience'):
+            company.required_experience = result.output.required_experience
+        if hasattr(result.output, 'required_skills'):
+            company.required_skills = result.output.required_skills
+        if hasattr(result.output, 'company_name') and not company.name:
+            company.name = result.output.company_name
+        
+        # Save to database
+        with track_stage("save_company"):
+            # The analysis row and its link to the job are committed together
+            company_id = await self.company_repo.create(company, job_id, description_hash)
+            if job_id is not None:
+                await self.skill_index.index_job(job_id, company.required_skills)
+        return company_id
+
+    async def parse_background(self, my_background: str) -> ParsedBackground:
+        """
+        Parse background text, reusing an earlier parse of the same text.
+
+        Parses are cached in memory and in the parsed_backgrounds table, keyed
+        by a hash of the text plus the model and parser version, so the
+        background parser runs once per profile rather than once per resume.
+        """
+        background_hash = self._background_hash(my_background)
+
+        background_info = self._parsed_backgrounds.get(background_hash)
+        if background_info is not None:
+            return background_info
+
+        # Concurrent first parses of the same background share one parser call
+        return await self._single_flight.do(
+            ("background", background_hash),
+            lambda: self._parse_background(my_background, background_hash)
+        )
+
+    async def _parse_background(self, my_background: str, background_hash: str) -> ParsedBackground:
+        """Load or run the background parse and remember it, timing the stage."""
+        with track_stage("parse_background"):
+            background_info = await self.background_repo.get(background_hash)
+            if background_info is None:
+                result = await self._run_agent(self.background_parser, my_background)
+                background_info = result.output
+                await self.background_repo.create(background_hash, background_info)
+            await self.skill_index.index_candidate(background_hash, background_info.skills_list)
+
+        self._parsed_backgrounds[background_hash] = background_info
+        return background_info
+
+    def _background_hash(self, my_background: str) -> str:
+        """Cache key of a background parse: the text plus model and parser version."""
+        return content_hash(my_background, self.model, BACKGROUND_PARSER_VERSION)
+
+    async def skill_match(self, job_id: str, my_background: str) -> SkillMatch:
+        """Matched and missing skills of a parsed background for an analyzed job."""
+        return await self.skill_index.match(job_id, self._background_hash(my_background))
+
+    async def jobs_missing_skill(self, skill: str, my_background: str) -> List[Dict]:
+        """Saved jobs asking for a skill that a parsed background lacks."""
+        return await self.skill_index.jobs_missing(skill, self._background_hash(my_background))
+
+    async def _load_parsed_background(self, background_hash: str) -> Optional[ParsedBackground]:
+        """Get an earlier background parse by its cache key."""
+        background_info = self._parsed_backgrounds.get(background_hash)
+        if background_info is None:
+            background_info = await self.background_repo.get(background_hash)
+        return background_info
 
-        # Check if resume already exists for this job
-        existing_resume = self.resume_repo.get_resume_by_job_id(job_id)
+    async def create_resume(self, company_id: int, my_background: str, job_id: str,
+                            concurrent: bool = True, generation_mode: Optional[str] = None) -> int:
+        """
+        Create a targeted resume based on job requirements.
+
+        Sections are checkpointed as they are stored. If a resume for the job
+        was left incomplete by a failure, only its missing sections are
+        generated; a complete one is returned as is.
+
+        Args:
+            company_id: ID of the analyzed company/job in the database
+            my_background: Free-text background of the candidate
+            job_id: ID of the job the resume targets
+            concurrent: Generate the five sections concurrently (bounded by
+                max_concurrency) instead of one after another
+            generation_mode: "per-section" (one call per section) or "compact"
+                (one call for all sections); defaults to config.GENERATION_MODE
+
+        Returns:
+            int: The resume ID in the database
+        """
+        generation_mode = generation_mode or GENERATION_MODE
+        if generation_mode not in GENERATION_MODES:
+            raise ValueError(f"Unknown generation mode: {generation_mode}")
+
+        with self._reporting(job_id) as report:
+            resume_id = await self._create_resume(
+                company_id, my_background, job_id, concurrent, generation_mode
+            )
+            if report is not None:
+                report.resume_id = resume_id
+            return resume_id
+
+    async def _create_resume(self, company_id: int, my_background: str, job_id: str,
+                             concurrent: bool, generation_mode: str) -> int:
+        """Build and store the resume, or finish an interrupted one, timing each stage."""
+        background_hash = self._background_hash(my_background)
+        with track_stage("load_job"):
+            # Get company information
+            company_data = await self.company_repo.get(company_id)
+            if not company_data:
+                raise ValueError("Company not found")
+
+            # Check if resume already exists for this job
+            pending = list(CHECKPOINT_SECTIONS)
+            existing_resume = await self._resume_db(self.resume_repo.get_resume_by_job_id, job_id)
+            if existing_resume:
+                pending = await self._sections_to_resume(existing_resume["id"], company_id, background_hash)
+                if not pending:
+                    print(f"Resume already exists for job {job_id}")
+                    return existing_resume["id"]
+                print(f"Resuming resume {existing_resume['id']} for job {job_id}: "
+                      f"{', '.join(pending)} incomplete")
+
+            # Get job application URL
+            from app.db.job_repository import JobRepository
+            job_repo = JobRepository(self.db_path)
+            application_url = await job_repo.get_application_url(job_id)
+
+        # First, parse the background information
+        background_info = await self.parse_background(my_background)
+
+        with track_stage("save_resume"):
+            resume_id = await self._start_resume(
+                existing_resume, company_data, job_id, application_url,
+                background_hash, background_info, pending
+            )
+
+        # Every section is stored and checkpointed as soon as it is generated,
+        # so a failure only costs the sections still missing; a retry resumes
+        # from there and reuses the finished ones
+        section_prompts = self._build_section_prompts(company_data, background_info)
+        compact_prompt = None
+        if generation_mode == "compact":
+            compact_prompt = self._build_compact_prompt(company_data, background_info)
+        tasks = self._section_tasks(
+            section_prompts, concurrent=concurrent,
+            sections=[section for section in RESUME_SECTIONS if section in pending],
+            compact_prompt=compact_prompt
+        )
+        async for _ in self._store_sections_as_ready(
+            resume_id, job_id, tasks, self._section_fingerprints(section_prompts),
+            clear_existing=bool(existing_resume)
+        ):
+            pass
+
+        return resume_id
+
+    async def _start_resume(self, existing_resume: Optional[Dict], company_data: Dict, job_id: str,
+                            application_url: Optional[str], background_hash: str,
+                            background_info: ParsedBackground, pending: List[str]) -> int:
+        """
+        Create the resume row with every section pending, or pick up an
+        existing one, and store the personal info if it is pending.
+        """
         if existing_resume:
-            print(f"Resume already exists for job {job_id}")
-            return existing_resume["id"]
+            resume_id = existing_resume["id"]
+        else:
+            resume_id = await self._create_resume_row(company_data, job_id, application_url, pending)
+        await self._resume_db(
+            self.resume_repo.set_resume_source, resume_id, company_data["id"], background_hash, write=True
+        )
+        if "personal_info" in pending:
+            await self._store_personal_info(resume_id, background_info, clear_existing=bool(existing_resume))
+        return resume_id
+
+    async def _sections_to_resume(self, resume_id: int, company_id: int, background_hash: str) -> List[str]:
+        """
+        Checkpointed sections of an existing resume that still need generating.
+
+        Resumes written before section checkpoints existed have no status rows
+        and count as complete. A resume whose job analysis or background has
+        changed since it was started is rebuilt entirely.
+        """
+        statuses = await self._resume_db(self.resume_repo.get_section_statuses, resume_id)
+        if not statuses:
+            return []
+        incomplete = [section for section in CHECKPOINT_SECTIONS if statuses.get(section) != "complete"]
+        if not incomplete:
+            return []
+        source = await self._resume_db(self.resume_repo.get_resume_source, resume_id)
+        if source != {"company_id": company_id, "background_hash": background_hash}:
+            return list(CHECKPOINT_SECTIONS)
+        return incomplete
+
+    async def is_resume_complete(self, resume_id: int) -> bool:
+        """Whether every section of a resume has been generated and stored."""
+        statuses = await self._resume_db(self.resume_repo.get_section_statuses, resume_id)
+        if not statuses:
+            # Written before section checkpoints existed
+            return True
+        return all(statuses.get(section) == "complete" for section in CHECKPOINT_SECTIONS)
+
+    async def refresh_resume(self, resume_id: int, my_background: Optional[str] = None,
+                             concurrent: bool = True) -> List[str]:
+        """
+        Regenerate only the sections of a resume whose inputs changed.
+
+        The job is re-analyzed if its stored description changed (unchanged
+        descriptions reuse the cached analysis), the background is re-parsed if
+        a new one is given, and each section's prompt inputs are fingerprinted
+        together with the model and SECTION_PROMPT_VERSION. Sections whose
+        fingerprint differs from the stored one are regenerated and replaced.
+
+        Args:
+            resume_id: ID of the resume to refresh
+            my_background: New background text; defaults to the one the
+                resume was generated from
+            concurrent: Generate stale sections concurrently
+
+        Returns:
+            List[str]: The sections that were regenerated
+        """
+        resume = await self._resume_db(self.resume_repo.get_resume, resume_id)
+        if not resume:
+            raise ValueError("Resume not found")
+        source = await self._resume_db(self.resume_repo.get_resume_source, resume_id)
+        if not source:
+            raise ValueError(f"Resume {resume_id} has no recorded inputs to refresh from")
+
+        with self._reporting(resume["job_id"]):
+            # Pick up edits to the job posting; an unchanged description hits the analysis cache
+            company_id = source["company_id"]
+            from app.db.job_repository import JobRepository
+            job = await JobRepository(self.db_path).get(resume["job_id"]) if resume["job_id"] else None
+            if job:
+                company = Company(
+                    name=job["company"],
+                    job_title=job["title"],
+                    job_description=job["description"],
+                    location=job["location"],
+                    application_url=job["application_url"],
+                    seniority_level=job["seniority_level"]
+                )
+                company_id = await self.analyze_job_description_with_company(company, job_id=job["id"])
+            company_data = await self.company_repo.get(company_id)
+            if not company_data:
+                raise ValueError("Company not found")
+
+            if my_background is not None:
+                background_hash = self._background_hash(my_background)
+                background_info = await self.parse_background(my_background)
+            else:
+                background_hash = source["background_hash"]
+                background_info = await self._load_parsed_background(background_hash)
+                if background_info is None:
+                    raise ValueError(f"Parsed background for resume {resume_id} is no longer cached")
+
+            section_prompts = self._build_section_prompts(company_data, background_info)
+            fingerprints = self._section_fingerprints(section_prompts)
+            stored = await self._resume_db(self.resume_repo.get_section_fingerprints, resume_id)
+            stale = [section for section in RESUME_SECTIONS if stored.get(section) != fingerprints[section]]
+
+            section_outputs = await self._generate_sections(section_prompts, concurrent=concurrent, sections=stale)
+
+            with track_stage("save_resume"):
+                if background_hash != source["background_hash"]:
+                    await self._resume_db(
+                        self.resume_repo.set_section_status, resume_id, ["personal_info"], "pending", write=True
+                    )
+                    await self._store_personal_info(resume_id, background_info, clear_existing=True)
+                await self._resume_db(
+                    self.resume_repo.set_resume_source, resume_id, company_id, background_hash, write=True
+                )
+            if stale:
+                with track_stage("save_sections"):
+                    # Replaced in one transaction, so an interrupted refresh never
+                    # leaves a section half-written
+                    await self._save_sections(resume_id, section_outputs, fingerprints, replace=True)
+            await self._resume_db(self.resume_repo.touch_resume, resume_id, write=True)
+
+        return stale
+
+    async def stream_resume(self, company: Company, my_background: str, job_id: str,
+                            concurrent: bool = True,
+                            generation_mode: Optional[str] = None) -> AsyncIterator[ResumeEvent]:
+        """
+        Analyze a job and build its resume, yielding events as each step finishes.
+
+        Like create_resume, the resume row is created before generation and
+        every section is stored and reported as soon as its generator returns,
+        so a client can render the first section without waiting for the
+        slowest one. An interrupted resume for the job is picked up where it
+        stopped.
+
+        Args:
+            company: Company object containing job details
+            my_background: Free-text background of the candidate
+            job_id: ID of the job the resume targets
+            concurrent: Generate the five sections concurrently
+            generation_mode: "per-section" or "compact"; see create_resume
+
+        Yields:
+            ResumeEvent: analysis_done, background_parsed, resume_created, one
+            section_ready per generated section in completion order, then
+            resume_complete
+        """
+        generation_mode = generation_mode or GENERATION_MODE
+        if generation_mode not in GENERATION_MODES:
+            raise ValueError(f"Unknown generation mode: {generation_mode}")
+
+        company_id = await self.analyze_job_description_with_company(company, job_id=job_id)
+        background_hash = self._background_hash(my_background)
+        with self._reporting(job_id):
+            with track_stage("load_job"):
+                company_data = await self.company_repo.get(company_id)
+                pending = list(CHECKPOINT_SECTIONS)
+                existing_resume = await self._resume_db(self.resume_repo.get_resume_by_job_id, job_id)
+                if existing_resume:
+                    pending = await self._sections_to_resume(existing_resume["id"], company_id, background_hash)
+        yield ResumeEvent(type="analysis_done", job_id=job_id, company_id=company_id, data=company_data)
+
+        if existing_resume and not pending:
+            yield ResumeEvent(type="resume_complete", job_id=job_id, company_id=company_id,
+                              resume_id=existing_resume["id"], data={"existing": True})
+            return
+
+        with self._reporting(job_id):
+            background_info = await self.parse_background(my_background)
+        yield ResumeEvent(type="background_parsed", job_id=job_id, company_id=company_id,
+                          data=background_info.model_dump())
+
+        with self._reporting(job_id) as report:
+            from app.db.job_repository import JobRepository
+            application_url = await JobRepository(self.db_path).get_application_url(job_id)
+            section_prompts = self._build_section_prompts(company_data, background_info)
+
+            with track_stage("save_resume"):
+                resume_id = await self._start_resume(
+                    existing_resume, company_data, job_id, application_url,
+                    background_hash, background_info, pending
+                )
+            if report is not None:
+                report.resume_id = resume_id
+
+            # Tasks copy the current context, so their stages land in this job's report
+            compact_prompt = None
+            if generation_mode == "compact":
+                compact_prompt = self._build_compact_prompt(company_data, background_info)
+            tasks = self._section_tasks(
+                section_prompts, concurrent=concurrent,
+                sections=[section for section in RESUME_SECTIONS if section in pending],
+                compact_prompt=compact_prompt
+            )
+        try:
+            yield ResumeEvent(type="resume_created", job_id=job_id, company_id=company_id, resume_id=resume_id,
+                              data={"resumed": pending} if existing_resume else None)
+
+            async for section, output in self._store_sections_as_ready(
+                resume_id, job_id, tasks, self._section_fingerprints(section_prompts),
+                clear_existing=bool(existing_resume)
+            ):
+                yield ResumeEvent(type="section_ready", job_id=job_id, company_id=company_id,
+                                  resume_id=resume_id, section=section, data=output.model_dump())
+        finally:
+            # The generators already run; stop them if the client stops listening
+            # before their sections are stored, instead of paying for unused output
+            for task in tasks.values():
+                task.cancel()
+
+        yield ResumeEvent(type="resume_complete", job_id=job_id, company_id=company_id, resume_id=resume_id)
+
+    async def create_resumes(self, jobs: List[Job], my_background: str,
+                             max_concurrency: int = BATCH_MAX_CONCURRENCY,
+                             generation_mode: Optional[str] = None) -> AsyncIterator[ResumeBatchResult]:
+        """
+        Store, analyze and build resumes for many jobs concurrently.
+
+        At most max_concurrency jobs are in flight at once, started in the
+        order given (e.g. best relevance first). Results are yielded
+        as each job finishes, and a failing job is reported through
+        ResumeBatchResult.error instead of stopping the batch. A job with no
+        analysis or resume of its own that is a near-duplicate of an already
+        processed one reuses its analysis and resume (see
+        ResumeBatchResult.duplicate_of).
+
+        Args:
+            jobs: Jobs to build resumes for
+            my_background: Free-text background of the candidate
+            max_concurrency: Maximum number of jobs processed at once
+            generation_mode: "per-section" or "compact"; see create_resume
+
+        Yields:
+            ResumeBatchResult: The outcome of each job, in completion order
+        """
+        # Parse the background once up front; every job reuses the cached parse
+        await self.parse_background(my_background)
 
-        # Get job application URL
         from app.db.job_repository import JobRepository
         job_repo = JobRepository(self.db_path)
-        application_url = await job_repo.get_application_url(job_id)
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        # First, parse the background information
-        parsed_background = await self.background_parser.run(my_background)
-        background_info = parsed_background.output
+        async def process(job: Job) -> ResumeBatchResult:
+            async with semaphore:
+                report = ResumeReport(job_id=job.id)
+                self.reports[job.id] = report
+                batch_result = ResumeBatchResult(job_id=job.id, report=report)
+                with recording(report):
+                    try:
+                        with track_stage("store_job"):
+                            await job_repo.create(job)
+                        batch_result.duplicate_of = await self._reuse_near_duplicate(job)
+                        company = Company(
+                            name=job.company,
+                            job_title=job.title,
+                            job_description=job.description,
+                            location=job.location,
+                            application_url=job.application_url,
+                            seniority_level=job.seniority_level
+                        )
+                        batch_result.company_id = await self.analyze_job_description_with_company(
+                            company, job_id=job.id
+                        )
+                        if batch_result.duplicate_of is not None:
+                            batch_result.resume_id = await self._duplicate_resume(
+                                batch_result.duplicate_of, my_background
+                            )
+                        if batch_result.resume_id is None:
+                            batch_result.resume_id = await self.create_resume(
+                                batch_result.company_id, my_background, job.id,
+                                generation_mode=generation_mode
+                            )
+                    except Exception as e:
+                        batch_result.error = str(e)
+                return batch_result
 
-        # Create description with application URL
-        description = f"Targeted resume for position at {company_data['name']}"
-        if application_url:
-            description += f"\nApplication URL: {application_url}"
+        tasks = [asyncio.create_task(process(job)) for job in jobs]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Stop outstanding work if the caller abandons the batch early
+            for task in tasks:
+                task.cancel()
 
-        # Create resume in database
-        resume_id = self.resume_repo.create_resume(
-            name=f"Resume for {company_data['name']}",
-            job_id=job_id,
-            description=description
-        )            # Add basic personal information
-        # Create a basic contact string from primary contact methods (email and phone)
-        primary_contacts = [
-            detail.detail_info 
-            for detail in background_info.personal_info.contact_details
-            if detail.detail_name in ['Email', 'Phone']
-        ]
-        contact_info = " | ".join(primary_contacts)
-        
-        self.resume_repo.add_personal_info(
-            resume_id=resume_id,
-            name=background_info.personal_info.name,
-            contact_info=contact_info
-        )
-        
-        # Add detailed contact information for UI display
-        for detail in background_info.personal_info.contact_details:
-            self.resume_repo.add_personal_info_detail(
-                resume_id=resume_id,
-                detail_name=detail.detail_name,
-                detail_icon=detail.detail_icon,
-                detail_info=detail.detail_info
+    async def _reuse_near_duplicate(self, job: Job) -> Optional[str]:
+        """
+        Index a job and, if it is a near-duplicate of an analyzed job, point it
+        at that job's analysis.
+
+        Only a job with neither an analysis of its current description nor a
+        resume of its own reuses another job's work; a re-run keeps each job's
+        own resume. The job is linked to the duplicate's company row under its
+        own description hash, so the analysis lookup finds it without calling
+        the analyzer; create_resumes then reuses the duplicate's resume if it
+        was built from the same background.
+
+        Returns:
+            Optional[str]: ID of the job whose work is reused, or None
+        """
+        if self.near_duplicates is None:
+            return None
+        with track_stage("near_duplicate_lookup"):
+            description_hash = content_hash(job.description)
+            has_own_work = (
+                await self.company_repo.get_by_job(job.id, description_hash) is not None
+                or await self._resume_db(self.resume_repo.get_resume_by_job_id, job.id) is not None
             )
+            match = None
+            if not has_own_work:
+                match = await self.near_duplicates.find(job.description, exclude_job_id=job.id)
+            await self.near_duplicates.add(job.id, job.description)
+            if match is None:
+                return None
+            duplicate_of, similarity = match
+            company_id = await self.company_repo.get_latest_by_job(duplicate_of)
+            if company_id is None:
+                return None
+            await self.company_repo.link_job(job.id, description_hash, company_id)
+            company_data = await self.company_repo.get(company_id)
+            await self.skill_index.index_job(job.id, company_data.get('required_skills'))
+        print(f"Job {job.id} is a near-duplicate of job {duplicate_of} ({similarity:.0%} similar); reusing its analysis")
+        return duplicate_of
+
+    async def _duplicate_resume(self, duplicate_of: str, my_background: str) -> Optional[int]:
+        """ID of the near-duplicate job's complete resume, if it was built from the same background."""
+        resume = await self._resume_db(self.resume_repo.get_resume_by_job_id, duplicate_of)
+        if not resume or not await self.is_resume_complete(resume["id"]):
+            return None
+        source = await self._resume_db(self.resume_repo.get_resume_source, resume["id"])
+        if not source or source["background_hash"] != self._background_hash(my_background):
+            return None
+        return resume["id"]
+
+    def _build_section_prompts(self, company_data: Dict, background_info: ParsedBackground) -> Dict[str, str]:
+        """
+        Build the user prompt for every resume section generator.
+
+        Each prompt gets its own slice of the job description, trimmed to the
+        section's token budget, instead of the full text.
+        """
+        job_views = {
+            section: compact_job_description(
+                company_data['job_description'], section,
+                self.section_token_budgets.get(section)
+            )
+            for section in RESUME_SECTIONS
+        }
 
-        # Generate and add summary
         summary_prompt = f"""
         Job Title: {company_data['job_title']}
-        Job Description: {company_data['job_description']}
+        Job Description: {job_views['summary']}
         Required Education: {company_data.get('required_education', '')}
         Required Experience: {company_data.get('required_experience', '')}
         Required Skills: {company_data.get('required_skills', '')}
         My Experience: {', '.join(exp.title for exp in background_info.work_history)}
         My Skills: {', '.join(background_info.skills_list)}
         """
-        summary_result = await self.summary_generator.run(summary_prompt)
-        self.resume_repo.add_summary(resume_id, summary_result.output.content)
 
-        # Generate and add skills
         skills_prompt = f"""
         Required Skills: {company_data.get('required_skills', '')}
         My Skills: {', '.join(background_info.skills_list)}
-        Role Requirements: {company_data['job_description']}
+        Role Requirements: {job_views['skills']}
         """
-        skills_result = await self.skills_generator.run(skills_prompt)
-        for category in skills_result.output.categories:
-            category_id = self.resume_repo.add_skill_category(
-                resume_id=resume_id,
-                name=category.name
-            )
-            for skill in category.skills:
-                self.resume_repo.add_skill(
-                    resume_id=resume_id,
-                    category_id=category_id,
-                    data={"name": skill.name, "proficiency": skill.proficiency}
-                )
 
-        # Generate and add experience entries
         experience_prompt = f"""
         Job Title: {company_data['job_title']}
-        Job Description: {company_data['job_description']}
+        Job Description: {job_views['experience']}
         Required Experience: {company_data.get('required_experience', '')}
         Required Skills: {company_data.get('required_skills', '')}
         
@@ -603,19 +787,7 @@ class AIResumeBuilder:
         3. Increment display_order for each subsequent (older) position
         4. Ensure experiences are ordered exactly as in the original work history
         """
-        experience_result = await self.experience_generator.run(experience_prompt)
-        for exp in experience_result.output.experiences:
-            exp_data = {
-                "job_title": exp.job_title,
-                "company": exp.company,
-                "location": exp.location,
-                "date_range": exp.date_range,
-                "display_order": exp.display_order,  # Include the display_order
-                "accomplishments": exp.accomplishments
-            }
-            self.resume_repo.add_experience(resume_id, exp_data)
-
-        # Generate and add education entries
+
         education_prompt = f"""
         Job Title: {company_data['job_title']}
         Required Education: {company_data.get('required_education', '')}
@@ -638,22 +810,11 @@ class AIResumeBuilder:
         5. Include metrics and numbers when available
         6. Remove any generic or verbose language
         """
-        education_result = await self.education_generator.run(education_prompt)
-        for edu in education_result.output.education:
-            edu_data = {
-                "degree": edu.degree,
-                "institution": edu.institution,
-                "location": edu.location,
-                "date_range": edu.date_range,
-                "description": edu.description
-            }
-            self.resume_repo.add_education(resume_id, edu_data)
-
-        # Generate and add project entries
+
         projects_prompt = f"""
         Job Title: {company_data['job_title']}
         Required Skills: {company_data.get('required_skills', '')}
-        Job Requirements: {company_data['job_description']}
+        Job Requirements: {job_views['projects']}
 
         Original Project Details:
         {[{
@@ -671,14 +832,289 @@ class AIResumeBuilder:
         5. Order projects by relevance to {company_data['name']}'s requirements
         6. Focus on technical implementation and measurable results
         """
-        projects_result = await self.projects_generator.run(projects_prompt)
-        for project in projects_result.output.projects:
-            project_data = {
-                "title": project.title,
-                "technologies": project.technologies,
-                "link": project.link,
-                "description": project.description
-            }
-            self.resume_repo.add_project(resume_id, project_data)
 
-        return resume_id
+        return {
+            "summary": summary_prompt,
+            "skills": skills_prompt,
+            "experience": experience_prompt,
+            "education": education_prompt,
+            "projects": projects_prompt
+        }
+
+    async def _create_resume_row(self, company_data: Dict, job_id: str, application_url: Optional[str],
+                                 pending: List[str]) -> int:
+        """Insert the resumes row for a job, with its pending sections, and return its ID."""
+        # Create description with application URL
+        description = f"Targeted resume for position at {company_data['name']}"
+        if application_url:
+            description += f"\nApplication URL: {application_url}"
+
+        # Create resume in database
+        return await self._resume_db(
+            self.resume_repo.create_resume,
+            name=f"Resume for {company_data['name']}",
+            job_id=job_id,
+            description=description,
+            pending_sections=pending,
+            write=True
+        )
+
+    def _build_compact_prompt(self, company_data: Dict, background_info: ParsedBackground) -> str:
+        """Build the single user prompt used by the compact generation mode."""
+        job_view = compact_job_description(
+            company_data['job_description'], "compact",
+            self.section_token_budgets.get("compact")
+        )
+        return f"""
+        Company: {company_data['name']}
+        Job Title: {company_data['job_title']}
+        Job Description: {job_view}
+        Required Education: {company_data.get('required_education', '')}
+        Required Experience: {company_data.get('required_experience', '')}
+        Required Skills: {company_data.get('required_skills', '')}
+
+        My Skills: {', '.join(background_info.skills_list)}
+
+        My Work History (already in reverse chronological order):
+        {[{
+            "title": exp.title,
+            "company": exp.company,
+            "date_range": exp.date_range,
+            "location": exp.location,
+            "responsibilities": exp.key_responsibilities
+        } for exp in background_info.work_history]}
+
+        My Education:
+        {[{
+            "degree": edu.degree,
+            "institution": edu.institution,
+            "date_range": edu.date_range,
+            "location": edu.location,
+            "description": edu.description
+        } for edu in background_info.education_history]}
+
+        My Projects:
+        {[{
+            "title": proj.title,
+            "technologies": proj.technologies,
+            "description": proj.description,
+            "link": proj.link
+        } for proj in background_info.project_history]}
+        """
+
+    async def _generate_compact(self, prompt: str) -> Dict[str, Any]:
+        """Generate every section with a single resume_generator call."""
+        with track_stage("generate_resume"):
+            result = await self._run_agent(self.resume_generator, prompt)
+        return {section: getattr(result.output, section) for section in RESUME_SECTIONS}
+
+    def _section_fingerprints(self, prompts: Dict[str, str]) -> Dict[str, str]:
+        """Fingerprint each section's prompt inputs together with the model and prompt version."""
+        return {
+            section: content_hash(prompt, self.model, SECTION_PROMPT_VERSION)
+            for section, prompt in prompts.items()
+        }
+
+    async def _generate_sections(self, prompts: Dict[str, str], concurrent: bool = True,
+                                 sections: Iterable[str] = RESUME_SECTIONS) -> Dict[str, Any]:
+        """
+        Run the section generators and collect their outputs.
+
+        With concurrent=True the generators are fanned out with asyncio.gather,
+        at most max_concurrency at a time; otherwise they run one by one.
+        """
+        tasks = self._section_tasks(prompts, concurrent=concurrent, sections=sections)
+        try:
+            outputs = await asyncio.gather(*tasks.values())
+        except BaseException:
+            # One failed generator fails the resume; stop paying for the others
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return dict(zip(tasks.keys(), outputs))
+
+    def _section_tasks(self, prompts: Dict[str, str], concurrent: bool = True,
+                       sections: Iterable[str] = RESUME_SECTIONS,
+                       compact_prompt: Optional[str] = None) -> Dict[str, "asyncio.Task"]:
+        """
+        Start one task per section generator, at most max_concurrency running at a time.
+
+        With a compact_prompt, a single resume_generator call produces every
+        section instead, and each section's task picks its part of the result.
+        No call is started when there are no sections to generate.
+        """
+        sections = list(sections)
+        if not sections:
+            return {}
+        if compact_prompt is not None:
+            compact = asyncio.ensure_future(self._generate_compact(compact_prompt))
+
+            async def pick(section: str) -> Any:
+                return (await compact)[section]
+
+            return {section: asyncio.create_task(pick(section)) for section in sections}
+
+        semaphore = asyncio.Semaphore(self.max_concurrency if concurrent else 1)
+
+        async def generate(section: str) -> Any:
+            async with semaphore:
+                with track_stage(f"generate_{section}"):
+                    agent = getattr(self, f"{section}_generator")
+                    result = await self._run_agent(agent, prompts[section])
+                    return result.output
+
+        return {section: asyncio.create_task(generate(section)) for section in sections}
+
+    async def _store_sections_as_ready(self, resume_id: int, job_id: str, tasks: Dict[str, "asyncio.Task"],
+                                       fingerprints: Dict[str, str],
+                                       clear_existing: bool = False) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Store each section as its generator finishes and checkpoint it as complete.
+
+        Sections finishing at the same time, such as every section of a
+        compact generation, are written in a single transaction. A failed
+        generator marks its section failed while the other sections are
+        still stored; the first error is raised once all have finished.
+
+        Args:
+            resume_id: Resume the sections belong to
+            job_id: Job whose report the save stages are recorded in
+            tasks: Section generator tasks, see _section_tasks
+            fingerprints: Input fingerprint of each section
+            clear_existing: Delete rows left by an interrupted earlier attempt first
+
+        Yields:
+            Tuple[str, Any]: (section, generated output) in completion order
+        """
+        waiting = {task: section for section, task in tasks.items()}
+        error = None
+        try:
+            while waiting:
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                outputs = {}
+                for task in done:
+                    section = waiting.pop(task)
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        await self._resume_db(
+                            self.resume_repo.set_section_status,
+                            resume_id, [section], "failed", str(task.exception()), write=True
+                        )
+                        continue
+                    outputs[section] = task.result()
+                if not outputs:
+                    continue
+                # Sections finishing together are written in one transaction
+                with self._reporting(job_id):
+                    with track_stage("save_sections"):
+                        await self._save_sections(resume_id, outputs, fingerprints, replace=clear_existing)
+                for section, output in outputs.items():
+                    yield section, output
+        finally:
+            # Stop outstanding generators if the caller stops listening
+            for task in tasks.values():
+                task.cancel()
+        if error is not None:
+            raise error
+
+    async def _store_personal_info(self, resume_id: int, background_info: ParsedBackground,
+                                   clear_existing: bool = False) -> None:
+        """Save the personal info section and checkpoint it as complete."""
+        if clear_existing:
+            await self._resume_db(self.resume_repo.delete_section, resume_id, "personal_info", write=True)
+        await self._save_personal_info(resume_id, background_info)
+        await self._resume_db(
+            self.resume_repo.set_section_status, resume_id, ["personal_info"], "complete", write=True
+        )
+
+    async def _save_personal_info(self, resume_id: int, background_info: ParsedBackground) -> None:
+        """
+        Point a resume at the stored profile holding the candidate's personal
+        and contact information.
+
+        A profile is stored once per version of the personal info, so resumes
+        built from the same background share its rows instead of copying them.
+        """
+        personal_info = background_info.personal_info
+        # Create a basic contact string from primary contact methods (email and phone)
+        primary_contacts = [
+            detail.detail_info
+            for detail in personal_info.contact_details
+            if detail.detail_name in ['Email', 'Phone']
+        ]
+        personal_info = personal_info.model_copy(update={"contact_info": " | ".join(primary_contacts)})
+
+        profile_hash = content_hash(personal_info.model_dump_json())
+        profile_id = self._profile_ids.get(profile_hash)
+        if profile_id is None:
+            profile_id = await self.profile_repo.get_or_create(profile_hash, personal_info)
+            self._profile_ids[profile_hash] = profile_id
+        await self.profile_repo.link_resume(resume_id, profile_id)
+
+    def _section_data(self, section: str, output: Any) -> Any:
+        """Rows of a generated section in the form ResumeRepository.save_sections takes."""
+        if section == "summary":
+            return output.content
+
+        elif section == "skills":
+            return [
+                {
+                    "name": category.name,
+                    "skills": [
+                        {"name": skill.name, "proficiency": skill.proficiency}
+                        for skill in category.skills
+                    ]
+                }
+                for category in output.categories
+            ]
+
+        elif section == "experience":
+            return [
+                {
+                    "job_title": exp.job_title,
+                    "company": exp.company,
+                    "location": exp.location,
+                    "date_range": exp.date_range,
+                    "display_order": exp.display_order,  # Include the display_order
+                    "accomplishments": exp.accomplishments
+                }
+                for exp in output.experiences
+            ]
+
+        elif section == "education":
+            return [
+                {
+                    "degree": edu.degree,
+                    "institution": edu.institution,
+                    "location": edu.location,
+                    "date_range": edu.date_range,
+                    "description": edu.description
+                }
+                for edu in output.education
+            ]
+
+        elif section == "projects":
+            return [
+                {
+                    "title": project.title,
+                    "technologies": project.technologies,
+                    "link": project.link,
+                    "description": project.description
+                }
+                for project in output.projects
+            ]
+
+        else:
+            raise ValueError(f"Unknown resume section: {section}")
+
+    async def _save_sections(self, resume_id: int, outputs: Dict[str, Any], fingerprints: Dict[str, str],
+                             replace: bool = False) -> None:
+        """Store generated sections, their fingerprints and completion in one transaction."""
+        await self._resume_db(
+            self.resume_repo.save_sections,
+            resume_id,
+            {section: self._section_data(section, output) for section, output in outputs.items()},
+            fingerprints={section: fingerprints[section] for section in outputs},
+            replace=replace,
+            write=True
+        )
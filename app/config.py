@@ -1,7 +1,99 @@
 """Configuration settings for the resume builder application."""
+import os
 from pathlib import Path
 
 # Database configuration
 # Set the external database path
 DATABASE_PATH = "/Users/rakshitmakan/Documents/resume_builder/database/resume.sqlite"
 DATABASE_DIR = Path(DATABASE_PATH).parent
+# SQLite storage mode: "default" keeps SQLite's rollback journal; "wal" enables
+# write-ahead logging, so reads go on while a write is in progress, and sends
+# every write through one serialized writer connection
+DB_STORAGE_MODE = os.getenv("RESUME_BUILDER_DB_STORAGE_MODE", "default")
+# synchronous level of WAL connections; NORMAL syncs at checkpoints instead of
+# every commit, and a power loss can only drop the last commits, not corrupt
+DB_WAL_SYNCHRONOUS = "NORMAL"
+# Threads running repository reads off the event loop; writes run on one
+# dedicated writer thread
+DB_READ_THREADS = 4
+
+# Generation settings
+# Maximum number of section generators running at once for a single resume
+GENERATION_MAX_CONCURRENCY = 5
+# Maximum number of jobs processed at once by AIResumeBuilder.create_resumes
+BATCH_MAX_CONCURRENCY = 4
+# Approximate token budget for the job description slice pasted into each
+# section prompt; a section mapped to None gets the full description
+SECTION_TOKEN_BUDGETS = {
+    "summary": 500,
+    "skills": 400,
+    "experience": 600,
+    "projects": 400,
+    "compact": 900,
+}
+# "per-section": one generator call per resume section (five round trips)
+# "compact": a single call producing every section in one structured response
+GENERATION_MODE = "per-section"
+
+# Model used by every resume builder agent
+LLM_MODEL = "openai:gpt-4o-mini"
+
+# LLM provider: "openai", or "offline" for a deterministic local stand-in
+# that needs no network access or API key
+LLM_PROVIDER = os.getenv("RESUME_BUILDER_LLM_PROVIDER", "openai")
+# Artificial latency (seconds) added to every offline LLM call
+OFFLINE_LATENCY_SECONDS = float(os.getenv("RESUME_BUILDER_OFFLINE_LATENCY", "0"))
+
+# Bump when the background parser prompt or ParsedBackground schema changes
+# so previously cached parses are no longer reused
+BACKGROUND_PARSER_VERSION = "1"
+
+# Bump when a section generator prompt changes so refresh_resume regenerates
+# sections that were produced by the old prompts
+SECTION_PROMPT_VERSION = "1"
+
+# LLM response cache settings
+LLM_CACHE_ENABLED = True
+# Total size of cached responses before least recently used entries are evicted
+LLM_CACHE_MAX_BYTES = 50 * 1024 * 1024
+# Cached responses older than this are treated as misses
+LLM_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+# A hit only records its access time when the stored one is older than this;
+# recorded accesses are written in one batch before the next eviction
+LLM_CACHE_TOUCH_INTERVAL_SECONDS = 60 * 60
+# Recorded accesses are also written once this many are pending, so a run
+# where every lookup hits still saves its LRU order
+LLM_CACHE_TOUCH_BATCH = 100
+
+# LLM request scheduler shared by every agent call
+LLM_REQUESTS_PER_MINUTE = 500
+LLM_TOKENS_PER_MINUTE = 200_000
+# Response size assumed when charging a request against the tokens budget
+LLM_RESPONSE_TOKEN_ESTIMATE = 1000
+# Retries of rate-limited (429) and server (5xx) errors, with jittered exponential backoff
+LLM_MAX_RETRIES = 5
+LLM_BACKOFF_BASE_SECONDS = 1.0
+LLM_BACKOFF_MAX_SECONDS = 60.0
+# Consecutive failures before calls fail fast, and how long until a trial call is let through
+LLM_CIRCUIT_FAILURE_THRESHOLD = 8
+LLM_CIRCUIT_RESET_SECONDS = 30.0
+
+# Hashed bag-of-words size used to pre-rank jobs against the background
+JOB_RANKING_FEATURES = 2 ** 14
+# Jobs whose relevance score (cosine similarity, 0-1) is below this are not
+# sent to the LLM; None processes every job, best matches first
+JOB_MIN_RELEVANCE_SCORE = None
+
+# Weight of a preferred skill relative to a required one in skill match scores
+PREFERRED_SKILL_WEIGHT = 0.5
+
+# Near-duplicate job detection (MinHash over word shingles, LSH index)
+NEAR_DUPLICATE_DETECTION = True
+# Estimated Jaccard similarity above which two descriptions are the same posting
+NEAR_DUPLICATE_THRESHOLD = 0.8
+# Words per shingle
+SHINGLE_SIZE = 5
+# Signature length and LSH bands (rows per band = permutations / bands); with
+# 16 bands of 8 rows a pair at similarity 0.8 becomes a candidate ~95% of the time
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 16
@@ -0,0 +1,33 @@
+from typing import Optional
+from app.models import ParsedBackground
+from app.db.connection import get_connection_manager, reads, writes
+
+class BackgroundRepository:
+    def __init__(self, db_path: str):
+        """Initialize repository with database path."""
+        self.db_path = db_path
+        self.connections = get_connection_manager(db_path)
+
+    @reads
+    def get(self, background_hash: str) -> Optional[ParsedBackground]:
+        """Get a parsed background by the hash of its source text."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT content FROM parsed_backgrounds WHERE background_hash = ?",
+                (background_hash,)
+            )
+            row = cursor.fetchone()
+            return ParsedBackground.model_validate_json(row['content']) if row else None
+
+    @writes
+    def create(self, background_hash: str, parsed_background: ParsedBackground) -> None:
+        """Store a parsed background, replacing any entry with the same hash."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            query = """
+            INSERT OR REPLACE INTO parsed_backgrounds (background_hash, content, created_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            """
+            cursor.execute(query, (background_hash, parsed_background.model_dump_json()))
+            conn.commit()
@@ -1,32 +1,24 @@
 from typing import Dict, Optional
-import sqlite3
-from pathlib import Path
 from app.models import Company
+from app.db.connection import get_connection_manager, reads, writes
 
 class CompanyRepository:
     def __init__(self, db_path: str):
         """Initialize repository with database path."""
         self.db_path = db_path
+        self.connections = get_connection_manager(db_path)
 
-    def connect(self):
-        """Create database connection."""
-        # Make sure the parent directory exists
-        db_path = Path(self.db_path)
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize database if needed
-        from app.db.init_db import init_database
-        init_database(str(db_path))
-        
-        # Connect to the database
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+    @writes
+    def create(self, company: Company, job_id: Optional[str] = None,
+               description_hash: Optional[str] = None) -> int:
+        """
+        Create a new company record.
 
-    async def create(self, company: Company) -> int:
-        """Create a new company record."""
-        conn = self.connect()
-        try:
+        With a job_id and description_hash, the job_analyses link is inserted
+        in the same transaction, so a failed link never leaves an unlinked
+        company row that the next run would duplicate.
+        """
+        with self.connections.writing() as conn:
             cursor = conn.cursor()
             query = """
             INSERT INTO company (
@@ -49,37 +41,79 @@ class CompanyRepository:
             )
             
             cursor.execute(query, values)
+            company_id = cursor.lastrowid
+            if job_id is not None:
+                self._link_job(cursor, job_id, description_hash, company_id)
             conn.commit()
-            return cursor.lastrowid
-        finally:
-            conn.close()
+            return company_id
 
-    async def get(self, company_id: int) -> Optional[Dict]:
+    @reads
+    def get(self, company_id: int) -> Optional[Dict]:
         """Get company by ID."""
-        conn = self.connect()
-        try:
+        with self.connections.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM company WHERE id = ?", (company_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
-        finally:
-            conn.close()
 
     def get_company(self, company_id: int) -> Optional[Dict]:
         """Legacy method for compatibility. Use get() instead."""
-        conn = self.connect()
-        try:
+        with self.connections.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM company WHERE id = ?", (company_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
-        finally:
-            conn.close()
 
-    async def update(self, company_id: int, data: Dict) -> bool:
+    @reads
+    def get_by_job(self, job_id: str, description_hash: str) -> Optional[int]:
+        """Get the company ID holding the analysis of a job's description version."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            query = """
+            SELECT ja.company_id
+            FROM job_analyses ja
+            JOIN company c ON c.id = ja.company_id
+            WHERE ja.job_id = ? AND ja.description_hash = ?
+            """
+            cursor.execute(query, (job_id, description_hash))
+            row = cursor.fetchone()
+            return row['company_id'] if row else None
+
+    @reads
+    def get_latest_by_job(self, job_id: str) -> Optional[int]:
+        """Get the company ID holding the most recent analysis of a job, whatever its description version."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            query = """
+            SELECT ja.company_id
+            FROM job_analyses ja
+            JOIN company c ON c.id = ja.company_id
+            WHERE ja.job_id = ?
+            ORDER BY ja.created_at DESC
+            LIMIT 1
+            """
+            cursor.execute(query, (job_id,))
+            row = cursor.fetchone()
+            return row['company_id'] if row else None
+
+    @writes
+    def link_job(self, job_id: str, description_hash: str, company_id: int) -> None:
+        """Record that a company row holds the analysis of a job's description version."""
+        with self.connections.writing() as conn:
+            self._link_job(conn.cursor(), job_id, description_hash, company_id)
+            conn.commit()
+
+    def _link_job(self, cursor, job_id: str, description_hash: str, company_id: int) -> None:
+        query = """
+        INSERT OR REPLACE INTO job_analyses (job_id, description_hash, company_id, created_at)
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        """
+        cursor.execute(query, (job_id, description_hash, company_id))
+
+    @writes
+    def update(self, company_id: int, data: Dict) -> bool:
         """Update company record."""
-        conn = self.connect()
-        try:
+        with self.connections.writing() as conn:
             cursor = conn.cursor()
             
             # Build update query dynamically based on provided data
@@ -92,16 +126,12 @@ class CompanyRepository:
             cursor.execute(query, values)
             conn.commit()
             return cursor.rowcount > 0
-        finally:
-            conn.close()
 
-    async def delete(self, company_id: int) -> bool:
+    @writes
+    def delete(self, company_id: int) -> bool:
         """Delete company record."""
-        conn = self.connect()
-        try:
+        with self.connections.writing() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM company WHERE id = ?", (company_id,))
             conn.commit()
             return cursor.rowcount > 0
-        finally:
-            conn.close()
@@ -0,0 +1,188 @@
+"""
+Shared SQLite connections for the repositories.
+
+Every repository for the same database file shares one ConnectionManager,
+which checks the schema once per process and hands out one long-lived
+connection per thread, instead of creating the schema and opening a fresh
+connection on every call.
+
+In "wal" storage mode the database uses write-ahead logging, so readers are
+not blocked by a write in progress, and all writes go through one writer
+connection, one at a time, so concurrent writers wait their turn instead of
+failing with "database is locked".
+
+The async repository methods run on database threads instead of the event
+loop: reads on a small pool, writes on one writer thread that takes them in
+submission order. DB I/O then overlaps with in-flight LLM calls.
+"""
+import asyncio
+import functools
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from app.config import DB_READ_THREADS, DB_STORAGE_MODE, DB_WAL_SYNCHRONOUS
+
+T = TypeVar("T")
+
+STORAGE_MODES = ("default", "wal")
+
+
+class ConnectionManager:
+    """One connection per thread to a SQLite database, created on first use."""
+
+    def __init__(self, db_path: str, storage_mode: str = DB_STORAGE_MODE):
+        if storage_mode not in STORAGE_MODES:
+            raise ValueError(f"Unknown storage mode: {storage_mode}")
+        self.db_path = str(db_path)
+        self.storage_mode = storage_mode
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.RLock()
+        self._executors_lock = threading.Lock()
+        self._read_executor: Optional[ThreadPoolExecutor] = None
+        self._write_executor: Optional[ThreadPoolExecutor] = None
+
+    def _ensure_schema(self) -> None:
+        """Create the database and its tables, once per process."""
+        if self._schema_ready:
+            return
+        with self._schema_lock:
+            if not self._schema_ready:
+                # Make sure the parent directory exists
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+                from app.db.init_db import init_database
+                init_database(self.db_path)
+                if self.storage_mode == "wal":
+                    # The journal mode is stored in the database file
+                    conn = sqlite3.connect(self.db_path)
+                    conn.execute("PRAGMA journal_mode = WAL")
+                    conn.close()
+                self._schema_ready = True
+
+    def _open(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        self._ensure_schema()
+        conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        if self.storage_mode == "wal":
+            conn.execute(f"PRAGMA synchronous = {DB_WAL_SYNCHRONOUS}")
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._open()
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow the calling thread's connection.
+
+        Work left uncommitted when the block raises is rolled back, so a
+        failed call never leaks a half-done transaction into the next one.
+        """
+        conn = self.get()
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+
+    @contextmanager
+    def writing(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow the connection for a block that writes.
+
+        In WAL mode this is the single writer connection shared by every
+        thread, held by one block at a time; otherwise it is the calling
+        thread's connection, as with connection().
+        """
+        if self.storage_mode != "wal":
+            with self.connection() as conn:
+                yield conn
+            return
+
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._open(check_same_thread=False)
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer.rollback()
+                raise
+
+    def _executor(self, write: bool) -> ThreadPoolExecutor:
+        with self._executors_lock:
+            if write:
+                if self._write_executor is None:
+                    self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-write")
+                return self._write_executor
+            if self._read_executor is None:
+                self._read_executor = ThreadPoolExecutor(
+                    max_workers=DB_READ_THREADS, thread_name_prefix="db-read"
+                )
+            return self._read_executor
+
+    async def run(self, call: Callable[..., T], *args: Any, write: bool = False, **kwargs: Any) -> T:
+        """
+        Run a blocking database call on a database thread without blocking the event loop.
+
+        Args:
+            call: Function doing the database work on the calling thread's connection
+            write: Run it on the writer thread, after every write submitted before it
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(write), functools.partial(call, *args, **kwargs))
+
+    def close(self) -> None:
+        """Close the calling thread's connection; the next call opens a new one."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def reads(method: Callable[..., T]) -> Callable[..., Any]:
+    """Make a blocking repository method a coroutine run on a database reader thread."""
+    @functools.wraps(method)
+    async def run(self, *args, **kwargs):
+        return await self.connections.run(method, self, *args, **kwargs)
+    return run
+
+
+def writes(method: Callable[..., T]) -> Callable[..., Any]:
+    """Make a blocking repository method a coroutine run on the database writer thread."""
+    @functools.wraps(method)
+    async def run(self, *args, **kwargs):
+        return await self.connections.run(method, self, *args, write=True, **kwargs)
+    return run
+
+
+_managers: Dict[str, ConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_connection_manager(db_path: str, storage_mode: Optional[str] = None) -> ConnectionManager:
+    """
+    The process-wide connection manager of a database file.
+
+    Args:
+        db_path: Path to the SQLite database
+        storage_mode: "default" or "wal" for a database not opened yet in this
+            process; None uses DB_STORAGE_MODE. A database keeps the mode it
+            was first opened with.
+    """
+    key = str(Path(db_path).resolve())
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = ConnectionManager(db_path, storage_mode or DB_STORAGE_MODE)
+        return manager
@@ -1,6 +1,8 @@
 import sqlite3
 from pathlib import Path
 
+from app.db.migrations import migrate
+
 def init_database(db_path: str):
     """Initialize the SQLite database with all required tables."""
     # Ensure the parent directory exists with proper permissions
@@ -200,7 +202,186 @@ def init_database(db_path: str):
     )
     """)
 
+    # Create job_analyses table (links a job and description version to its analysis)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS job_analyses (
+        job_id TEXT NOT NULL,
+        description_hash TEXT NOT NULL,
+        company_id INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (job_id, description_hash),
+        FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+        FOREIGN KEY (company_id) REFERENCES company(id) ON DELETE CASCADE
+    )
+    """)
+
+    # Create parsed_backgrounds table (cache of background_parser output)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS parsed_backgrounds (
+        background_hash TEXT PRIMARY KEY,
+        content TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+    # Create resume_sources table (analysis and background a resume was built from)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS resume_sources (
+        resume_id INTEGER PRIMARY KEY,
+        company_id INTEGER NOT NULL,
+        background_hash TEXT NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (resume_id) REFERENCES resumes(id) ON DELETE CASCADE,
+        FOREIGN KEY (company_id) REFERENCES company(id)
+    )
+    """)
+
+    # Create resume_sections table (fingerprint of the inputs each section was generated from)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS resume_sections (
+        resume_id INTEGER NOT NULL,
+        section TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (resume_id, section),
+        FOREIGN KEY (resume_id) REFERENCES resumes(id) ON DELETE CASCADE
+    )
+    """)
+
+    # Create profiles table (personal info stored once per version of a candidate profile)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS profiles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        profile_hash TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL,
+        contact_info TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+    # Create profile_contact_details table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS profile_contact_details (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        profile_id INTEGER NOT NULL,
+        detail_name TEXT NOT NULL,
+        detail_icon TEXT NOT NULL,
+        detail_info TEXT NOT NULL,
+        display_order INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (profile_id) REFERENCES profiles(id) ON DELETE CASCADE
+    )
+    """)
+
+    # Create resume_profiles table (the profile a resume shows personal info from)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS resume_profiles (
+        resume_id INTEGER PRIMARY KEY,
+        profile_id INTEGER NOT NULL,
+        FOREIGN KEY (resume_id) REFERENCES resumes(id) ON DELETE CASCADE,
+        FOREIGN KEY (profile_id) REFERENCES profiles(id)
+    )
+    """)
+
+    # Per-resume views in the shape of personal_info / personal_info_details,
+    # covering both profile-backed resumes and ones with their own rows
+    cursor.execute("""
+    CREATE VIEW IF NOT EXISTS resume_personal_info AS
+    SELECT rp.resume_id, p.name, p.contact_info, p.updated_at
+    FROM resume_profiles rp
+    JOIN profiles p ON p.id = rp.profile_id
+    UNION ALL
+    SELECT resume_id, name, contact_info, updated_at FROM personal_info
+    """)
+    cursor.execute("""
+    CREATE VIEW IF NOT EXISTS resume_personal_info_details AS
+    SELECT rp.resume_id, d.detail_name, d.detail_icon, d.detail_info, d.display_order, d.updated_at
+    FROM resume_profiles rp
+    JOIN profile_contact_details d ON d.profile_id = rp.profile_id
+    UNION ALL
+    SELECT resume_id, detail_name, detail_icon, detail_info, id, updated_at FROM personal_info_details
+    """)
+
+    # Create resume_section_status table (generation checkpoint of each resume section)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS resume_section_status (
+        resume_id INTEGER NOT NULL,
+        section TEXT NOT NULL,
+        status TEXT NOT NULL CHECK (status IN ('pending', 'complete', 'failed')),
+        error TEXT,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (resume_id, section),
+        FOREIGN KEY (resume_id) REFERENCES resumes(id) ON DELETE CASCADE
+    )
+    """)
+
+    # Create llm_cache table (content-addressed LLM responses)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS llm_cache (
+        cache_key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        last_accessed REAL NOT NULL
+    )
+    """)
+
+    # Create job_signatures table (MinHash signature of each job description)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS job_signatures (
+        job_id TEXT PRIMARY KEY,
+        description_hash TEXT NOT NULL,
+        signature TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
+    )
+    """)
+
+    # Create job_lsh_buckets table (LSH band buckets pointing at similar jobs)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS job_lsh_buckets (
+        bucket TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        PRIMARY KEY (bucket, job_id),
+        FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
+    )
+    """)
+
+    # Create canonical_skills table (normalized skill names shared by jobs and candidates)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS canonical_skills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE
+    )
+    """)
+
+    # Create job_skills table (skills a job requires or prefers)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS job_skills (
+        job_id TEXT NOT NULL,
+        skill_id INTEGER NOT NULL,
+        requirement TEXT NOT NULL CHECK (requirement IN ('required', 'preferred')),
+        PRIMARY KEY (job_id, skill_id),
+        FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+        FOREIGN KEY (skill_id) REFERENCES canonical_skills(id) ON DELETE CASCADE
+    )
+    """)
+
+    # Create candidate_skills table (skills of a parsed background)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS candidate_skills (
+        background_hash TEXT NOT NULL,
+        skill_id INTEGER NOT NULL,
+        PRIMARY KEY (background_hash, skill_id),
+        FOREIGN KEY (skill_id) REFERENCES canonical_skills(id) ON DELETE CASCADE
+    )
+    """)
+
     conn.commit()
+
+    # Schema changes after the baseline tables above
+    migrate(conn)
     conn.close()
 
 if __name__ == "__main__":
@@ -1,32 +1,17 @@
-import sqlite3
 from typing import List, Optional, Dict
-from pathlib import Path
 from app.models import Job
+from app.db.connection import get_connection_manager, reads, writes
 
 class JobRepository:
     def __init__(self, db_path: str):
         """Initialize repository with database path."""
         self.db_path = db_path
+        self.connections = get_connection_manager(db_path)
 
-    def connect(self):
-        """Create database connection."""
-        # Make sure the parent directory exists
-        db_path = Path(self.db_path)
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize database if needed
-        from app.db.init_db import init_database
-        init_database(str(db_path))
-        
-        # Connect to the database
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
-
-    async def create(self, job: Job) -> bool:
+    @writes
+    def create(self, job: Job) -> bool:
         """Create a new job record if it doesn't exist."""
-        conn = self.connect()
-        try:
+        with self.connections.writing() as conn:
             cursor = conn.cursor()
             
             # Check if job already exists
@@ -55,34 +40,28 @@ class JobRepository:
             cursor.execute(query, values)
             conn.commit()
             return True
-        finally:
-            conn.close()
     
-    async def get(self, job_id: str) -> Optional[Dict]:
+    @reads
+    def get(self, job_id: str) -> Optional[Dict]:
         """Get job by ID."""
-        conn = self.connect()
-        try:
+        with self.connections.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
-        finally:
-            conn.close()
 
-    async def get_all(self) -> List[Dict]:
+    @reads
+    def get_all(self) -> List[Dict]:
         """Get all jobs."""
-        conn = self.connect()
-        try:
+        with self.connections.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM jobs")
             return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
 
-    async def update(self, job_id: str, data: Dict) -> bool:
+    @writes
+    def update(self, job_id: str, data: Dict) -> bool:
         """Update job record."""
-        conn = self.connect()
-        try:
+        with self.connections.writing() as conn:
             cursor = conn.cursor()
             
             # Build update query dynamically based on provided fields
@@ -96,31 +75,25 @@ class JobRepository:
             cursor.execute(query, values)
             conn.commit()
             return cursor.rowcount > 0
-        finally:
-            conn.close()
 
-    async def delete(self, job_id: str) -> bool:
+    @writes
+    def delete(self, job_id: str) -> bool:
         """Delete job record."""
-        conn = self.connect()
-        try:
+        with self.connections.writing() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
             conn.commit()
             return cursor.rowcount > 0
-        finally:
-            conn.close()
 
     async def mark_as_applied(self, job_id: str) -> bool:
         """Mark a job as applied."""
         return await self.update(job_id, {"applied": True})
 
-    async def get_application_url(self, job_id: str) -> Optional[str]:
+    @reads
+    def get_application_url(self, job_id: str) -> Optional[str]:
         """Get job's application URL."""
-        conn = self.connect()
-        try:
+        with self.connections.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT application_url FROM jobs WHERE id = ?", (job_id,))
             row = cursor.fetchone()
             return row['application_url'] if row else None
-        finally:
-            conn.close()
@@ -0,0 +1,56 @@
+from typing import Dict, List, Optional
+import json
+from app.db.connection import get_connection_manager, reads, writes
+
+class JobSignatureRepository:
+    def __init__(self, db_path: str):
+        """Initialize repository with database path."""
+        self.db_path = db_path
+        self.connections = get_connection_manager(db_path)
+
+    @reads
+    def get_description_hash(self, job_id: str) -> Optional[str]:
+        """Get the hash of the description a job's signature was computed from."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT description_hash FROM job_signatures WHERE job_id = ?", (job_id,))
+            row = cursor.fetchone()
+            return row['description_hash'] if row else None
+
+    @writes
+    def save(self, job_id: str, description_hash: str, signature: List[int],
+             buckets: List[str]) -> None:
+        """Store a job's signature and replace its LSH bucket entries."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO job_signatures (job_id, description_hash, signature, created_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                (job_id, description_hash, json.dumps(signature))
+            )
+            cursor.execute("DELETE FROM job_lsh_buckets WHERE job_id = ?", (job_id,))
+            cursor.executemany(
+                "INSERT OR IGNORE INTO job_lsh_buckets (bucket, job_id) VALUES (?, ?)",
+                [(bucket, job_id) for bucket in buckets]
+            )
+            conn.commit()
+
+    @reads
+    def get_candidates(self, buckets: List[str]) -> Dict[str, List[int]]:
+        """Get the signatures of every job sharing at least one bucket, keyed by job ID."""
+        if not buckets:
+            return {}
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ", ".join("?" for _ in buckets)
+            query = f"""
+            SELECT s.job_id, s.signature
+            FROM job_signatures s
+            WHERE s.job_id IN (
+                SELECT DISTINCT job_id FROM job_lsh_buckets WHERE bucket IN ({placeholders})
+            )
+            """
+            cursor.execute(query, buckets)
+            return {row['job_id']: json.loads(row['signature']) for row in cursor.fetchall()}
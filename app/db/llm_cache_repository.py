@@ -0,0 +1,85 @@
+from typing import Dict, Optional
+from app.db.connection import get_connection_manager, reads, writes
+
+class LLMCacheRepository:
+    def __init__(self, db_path: str):
+        """Initialize repository with database path."""
+        self.db_path = db_path
+        self.connections = get_connection_manager(db_path)
+
+    @reads
+    def get(self, cache_key: str, min_created_at: float) -> Optional[Dict]:
+        """
+        Get a cached response created after min_created_at.
+
+        A read only: expired entries are left for evict, and last_accessed is
+        recorded separately through touch.
+
+        Returns:
+            Optional[Dict]: 'value' and 'last_accessed' of the entry, or None
+        """
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT value, last_accessed FROM llm_cache WHERE cache_key = ? AND created_at >= ?",
+                (cache_key, min_created_at)
+            )
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    @writes
+    def touch(self, accessed: Dict[str, float]) -> None:
+        """Record the last access time of many entries in one transaction."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "UPDATE llm_cache SET last_accessed = MAX(last_accessed, ?) WHERE cache_key = ?",
+                [(accessed_at, cache_key) for cache_key, accessed_at in accessed.items()]
+            )
+            conn.commit()
+
+    @writes
+    def put(self, cache_key: str, value: str, now: float) -> None:
+        """Store a response, replacing any entry with the same key."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            query = """
+            INSERT OR REPLACE INTO llm_cache (cache_key, value, size, created_at, last_accessed)
+            VALUES (?, ?, ?, ?, ?)
+            """
+            cursor.execute(query, (cache_key, value, len(value.encode("utf-8")), now, now))
+            conn.commit()
+
+    @writes
+    def evict(self, max_bytes: int, min_created_at: float) -> int:
+        """
+        Delete expired entries, then least recently used entries until the
+        total stored size fits in max_bytes. Returns the number of deleted rows.
+        """
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM llm_cache WHERE created_at < ?", (min_created_at,))
+            evicted = cursor.rowcount
+
+            cursor.execute("SELECT COALESCE(SUM(size), 0) AS total FROM llm_cache")
+            total = cursor.fetchone()['total']
+            if total > max_bytes:
+                cursor.execute("SELECT cache_key, size FROM llm_cache ORDER BY last_accessed ASC")
+                stale_keys = []
+                for row in cursor.fetchall():
+                    if total <= max_bytes:
+                        break
+                    stale_keys.append((row['cache_key'],))
+                    total -= row['size']
+                cursor.executemany("DELETE FROM llm_cache WHERE cache_key = ?", stale_keys)
+                evicted += len(stale_keys)
+
+            conn.commit()
+            return evicted
+
+    @writes
+    def clear(self) -> None:
+        """Delete every cached response."""
+        with self.connections.writing() as conn:
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
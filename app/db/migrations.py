@@ -0,0 +1,97 @@
+"""
+Versioned schema migrations.
+
+init_database creates the baseline tables; every schema change after that
+is a numbered migration here. The schema_version table records each applied
+migration, and migrate applies the missing ones in order, each in its own
+transaction together with its schema_version row, so a database is never
+left half-migrated. Append new migrations with the next version number;
+never edit or reorder one that has shipped.
+"""
+import sqlite3
+from typing import List, NamedTuple
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    statements: List[str]
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Index resumes by job and section rows by resume", [
+        "CREATE INDEX IF NOT EXISTS idx_resumes_job_id ON resumes (job_id)",
+        "CREATE INDEX IF NOT EXISTS idx_personal_info_resume_id ON personal_info (resume_id)",
+        "CREATE INDEX IF NOT EXISTS idx_personal_info_details_resume_id ON personal_info_details (resume_id)",
+        "CREATE INDEX IF NOT EXISTS idx_summary_resume_id ON summary (resume_id)",
+        "CREATE INDEX IF NOT EXISTS idx_education_resume_id ON education (resume_id)",
+        "CREATE INDEX IF NOT EXISTS idx_skill_categories_resume_id ON skill_categories (resume_id)",
+        "CREATE INDEX IF NOT EXISTS idx_skills_resume_id ON skills (resume_id)",
+        "CREATE INDEX IF NOT EXISTS idx_experience_resume_id ON experience (resume_id)",
+        "CREATE INDEX IF NOT EXISTS idx_job_accomplishments_resume_id ON job_accomplishments (resume_id)",
+        "CREATE INDEX IF NOT EXISTS idx_projects_resume_id ON projects (resume_id)",
+    ]),
+    Migration(2, "Index skills by category and accomplishments by experience", [
+        "CREATE INDEX IF NOT EXISTS idx_skills_category_id ON skills (category_id)",
+        "CREATE INDEX IF NOT EXISTS idx_job_accomplishments_experience_id ON job_accomplishments (experience_id)",
+    ]),
+    Migration(3, "Index unapplied jobs by scrape date", [
+        "CREATE INDEX IF NOT EXISTS idx_jobs_unapplied_scraped_date ON jobs (scraped_date) WHERE applied = 0",
+    ]),
+]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Version of the last migration applied to a database; 0 for the baseline schema."""
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        description TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def migrate(conn: sqlite3.Connection, migrations: List[Migration] = MIGRATIONS) -> int:
+    """
+    Apply the migrations a database is missing, in version order.
+
+    Args:
+        conn: Connection to the database, with no transaction open
+        migrations: Migrations to apply, defaults to MIGRATIONS
+
+    Returns:
+        int: Schema version after migrating
+    """
+    version = get_schema_version(conn)
+    for migration in sorted(migrations, key=lambda migration: migration.version):
+        if migration.version <= version:
+            continue
+        # Take the write lock before re-reading the version, so concurrent
+        # processes starting up apply each migration once
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if get_schema_version(conn) < migration.version:
+                for statement in migration.statements:
+                    conn.execute(statement)
+                conn.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                    (migration.version, migration.description)
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        version = migration.version
+    return version
+
+
+if __name__ == "__main__":
+    from app.config import DATABASE_PATH
+    from app.db.init_db import init_database
+    init_database(DATABASE_PATH)
+    conn = sqlite3.connect(DATABASE_PATH)
+    print(f"Database at {DATABASE_PATH} is at schema version {get_schema_version(conn)}")
+    conn.close()
@@ -0,0 +1,126 @@
+from typing import Dict, List, Optional
+import sqlite3
+from app.models import PersonalInfo
+from app.db.connection import get_connection_manager, reads, writes
+
+class ProfileRepository:
+    def __init__(self, db_path: str):
+        """Initialize repository with database path."""
+        self.db_path = db_path
+        self.connections = get_connection_manager(db_path)
+
+    @writes
+    def get_or_create(self, profile_hash: str, personal_info: PersonalInfo) -> int:
+        """Get the profile stored for a profile version, creating it with its contact details if new."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id FROM profiles WHERE profile_hash = ?", (profile_hash,))
+            row = cursor.fetchone()
+            if row:
+                return row['id']
+
+            cursor.execute(
+                """
+                INSERT INTO profiles (profile_hash, name, contact_info, created_at, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                """,
+                (profile_hash, personal_info.name, personal_info.contact_info or "")
+            )
+            profile_id = cursor.lastrowid
+            cursor.executemany(
+                """
+                INSERT INTO profile_contact_details (
+                    profile_id, detail_name, detail_icon, detail_info, display_order, updated_at
+                ) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                [
+                    (profile_id, detail.detail_name, detail.detail_icon, detail.detail_info, order)
+                    for order, detail in enumerate(personal_info.contact_details)
+                ]
+            )
+            conn.commit()
+            return profile_id
+
+    @writes
+    def link_resume(self, resume_id: int, profile_id: int) -> None:
+        """Point a resume at the profile its personal info comes from."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT OR REPLACE INTO resume_profiles (resume_id, profile_id) VALUES (?, ?)",
+                (resume_id, profile_id)
+            )
+            conn.commit()
+
+    def _profile(self, cursor: sqlite3.Cursor, profile_id: int) -> Optional[Dict]:
+        cursor.execute("SELECT * FROM profiles WHERE id = ?", (profile_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        profile = dict(row)
+        cursor.execute(
+            """
+            SELECT detail_name, detail_icon, detail_info
+            FROM profile_contact_details
+            WHERE profile_id = ?
+            ORDER BY display_order
+            """,
+            (profile_id,)
+        )
+        profile['contact_details'] = [dict(detail) for detail in cursor.fetchall()]
+        return profile
+
+    @reads
+    def get(self, profile_id: int) -> Optional[Dict]:
+        """Get a profile with its contact details."""
+        with self.connections.connection() as conn:
+            return self._profile(conn.cursor(), profile_id)
+
+    @reads
+    def get_by_resume(self, resume_id: int) -> Optional[Dict]:
+        """Get the profile a resume shows, with its contact details."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT profile_id FROM resume_profiles WHERE resume_id = ?", (resume_id,))
+            row = cursor.fetchone()
+            return self._profile(cursor, row['profile_id']) if row else None
+
+    @writes
+    def update_contact_detail(self, profile_id: int, detail_name: str, detail_info: str) -> bool:
+        """Change one contact detail of a profile; every resume using it shows the new value."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE profile_contact_details
+                SET detail_info = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE profile_id = ? AND detail_name = ?
+                """,
+                (detail_info, profile_id, detail_name)
+            )
+            updated = cursor.rowcount > 0
+            if updated and detail_name in ('Email', 'Phone'):
+                # Keep the basic contact string in step with the detail rows
+                cursor.execute(
+                    """
+                    SELECT detail_info FROM profile_contact_details
+                    WHERE profile_id = ? AND detail_name IN ('Email', 'Phone')
+                    ORDER BY display_order
+                    """,
+                    (profile_id,)
+                )
+                contact_info = " | ".join(row['detail_info'] for row in cursor.fetchall())
+                cursor.execute(
+                    "UPDATE profiles SET contact_info = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    (contact_info, profile_id)
+                )
+            conn.commit()
+            return updated
+
+    @reads
+    def get_resume_ids(self, profile_id: int) -> List[int]:
+        """Get the resumes showing a profile."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT resume_id FROM resume_profiles WHERE profile_id = ?", (profile_id,))
+            return [row['resume_id'] for row in cursor.fetchall()]
@@ -1,94 +1,108 @@
 from typing import Any, Dict, List, Optional
-import sqlite3
+from app.db.connection import get_connection_manager
+from app.models import (
+    Education, Experience, FullResume, PersonalInfo, PersonalInfoDetail, Project, Skill, SkillCategory
+)
+from collections import defaultdict
 from datetime import datetime
+import json
+
+# Tables holding each resume section's rows, children before parents
+SECTION_TABLES = {
+    "personal_info": ["personal_info_details", "personal_info", "resume_profiles"],
+    "summary": ["summary"],
+    "skills": ["skills", "skill_categories"],
+    "experience": ["job_accomplishments", "experience"],
+    "education": ["education"],
+    "projects": ["projects"],
+}
+
+# Sections save_sections writes; personal info is stored through profiles
+BATCH_SECTIONS = ("summary", "skills", "experience", "education", "projects")
+
+INSERT_ACCOMPLISHMENT = """
+INSERT INTO job_accomplishments (
+    resume_id, experience_id, description,
+    display_order, is_visible, updated_at
+) VALUES (?, ?, ?, ?, 1, CURRENT_TIMESTAMP)
+"""
 
 class ResumeRepository:
     def __init__(self, db_path: str):
         """Initialize repository with database path."""
         self.db_path = db_path
-        self.conn = None
-        self.cursor = None
-
-    def connect(self):
-        """Create database connection."""
-        if not self.conn:
-            self.conn = sqlite3.connect(self.db_path)
-            self.cursor = self.conn.cursor()
-            # Enable foreign keys
-            self.cursor.execute("PRAGMA foreign_keys = ON")
+        self.connections = get_connection_manager(db_path)
 
     def close(self):
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
-            self.cursor = None
-
-    def create_resume(self, name: str, job_id: str, description: Optional[str] = None) -> int:
-        """Create a new resume and return its ID."""
-        self.connect()
-        try:
+        """Close this thread's database connection."""
+        self.connections.close()
+
+    def create_resume(self, name: str, job_id: str, description: Optional[str] = None,
+                      pending_sections: Optional[List[str]] = None) -> int:
+        """
+        Create a new resume and return its ID.
+
+        pending_sections are checkpointed as 'pending' in the same transaction,
+        so a resume whose build is cut short never exists without status rows
+        (which would make it look like a complete pre-checkpoint resume).
+        """
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
             query = """
             INSERT INTO resumes (name, job_id, description, created_at, updated_at)
             VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """
-            self.cursor.execute(query, (name, job_id, description))
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            cursor.execute(query, (name, job_id, description))
+            resume_id = cursor.lastrowid
+            if pending_sections:
+                cursor.executemany("""
+                INSERT INTO resume_section_status (resume_id, section, status, updated_at)
+                VALUES (?, ?, 'pending', CURRENT_TIMESTAMP)
+                """, [(resume_id, section) for section in pending_sections])
+            conn.commit()
+            return resume_id
 
     def add_personal_info(self, resume_id: int, name: str, contact_info: str) -> int:
         """Add personal information for a resume."""
-        self.connect()
-        try:
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
             query = """
             INSERT INTO personal_info (resume_id, name, contact_info, updated_at)
             VALUES (?, ?, ?, CURRENT_TIMESTAMP)
             """
-            self.cursor.execute(query, (resume_id, name, contact_info))
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            cursor.execute(query, (resume_id, name, contact_info))
+            conn.commit()
+            return cursor.lastrowid
 
     def add_personal_info_detail(self, resume_id: int, detail_name: str, detail_icon: str, detail_info: str) -> int:
         """Add personal information detail for a resume."""
-        self.connect()
-        try:
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
             query = """
             INSERT INTO personal_info_details (
                 resume_id, detail_name, detail_icon, detail_info, updated_at
             ) VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
             """
-            self.cursor.execute(query, (resume_id, detail_name, detail_icon, detail_info))
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            cursor.execute(query, (resume_id, detail_name, detail_icon, detail_info))
+            conn.commit()
+            return cursor.lastrowid
 
     def add_summary(self, resume_id: int, content: str) -> int:
         """Add professional summary to a resume."""
-        self.connect()
-        try:
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
             query = """
             INSERT INTO summary (resume_id, content, updated_at)
             VALUES (?, ?, CURRENT_TIMESTAMP)
             """
-            self.cursor.execute(query, (resume_id, content))
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            cursor.execute(query, (resume_id, content))
+            conn.commit()
+            return cursor.lastrowid
 
     def add_education(self, resume_id: int, data: Dict[str, Any]) -> int:
         """Add education entry to a resume."""
-        self.connect()
-        try:
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
             query = """
             INSERT INTO education (
                 resume_id, degree, institution, location, 
@@ -106,33 +120,27 @@ class ResumeRepository:
                 data.get('is_visible', 1),
                 data.get('display_order', 0)
             )
-            self.cursor.execute(query, params)
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            cursor.execute(query, params)
+            conn.commit()
+            return cursor.lastrowid
 
     def add_skill_category(self, resume_id: int, name: str, display_order: Optional[int] = None) -> int:
         """Add a skill category to a resume."""
-        self.connect()
-        try:
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
             query = """
             INSERT INTO skill_categories (
                 resume_id, name, display_order, is_visible, updated_at
             ) VALUES (?, ?, ?, 1, CURRENT_TIMESTAMP)
             """
-            self.cursor.execute(query, (resume_id, name, display_order))
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            cursor.execute(query, (resume_id, name, display_order))
+            conn.commit()
+            return cursor.lastrowid
 
     def add_skill(self, resume_id: int, category_id: int, data: Dict[str, Any]) -> int:
         """Add a skill to a category."""
-        self.connect()
-        try:
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
             query = """
             INSERT INTO skills (
                 resume_id, category_id, name, proficiency,
@@ -147,17 +155,14 @@ class ResumeRepository:
                 data.get('is_visible', 1),
                 data.get('display_order', 0)
             )
-            self.cursor.execute(query, params)
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            cursor.execute(query, params)
+            conn.commit()
+            return cursor.lastrowid
 
     def add_experience(self, resume_id: int, data: Dict[str, Any]) -> int:
         """Add work experience to a resume."""
-        self.connect()
-        try:
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
             query = """
             INSERT INTO experience (
                 resume_id, job_title, company, location,
@@ -173,47 +178,32 @@ class ResumeRepository:
                 data.get('is_visible', 1),
                 data.get('display_order', 0)
             )
-            self.cursor.execute(query, params)
-            exp_id = self.cursor.lastrowid
+            cursor.execute(query, params)
+            exp_id = cursor.lastrowid
 
-            # Add accomplishments if provided
+            # Add accomplishments if provided, in the same transaction
             if 'accomplishments' in data and data['accomplishments']:
-                for idx, desc in enumerate(data['accomplishments']):
-                    self.add_job_accomplishment(
-                        resume_id=resume_id,
-                        experience_id=exp_id,
-                        description=desc,
-                        display_order=idx
-                    )
+                cursor.executemany(INSERT_ACCOMPLISHMENT, [
+                    (resume_id, exp_id, desc, idx)
+                    for idx, desc in enumerate(data['accomplishments'])
+                ])
 
-            self.conn.commit()
+            conn.commit()
             return exp_id
-        except Exception as e:
-            self.conn.rollback()
-            raise e
 
     def add_job_accomplishment(self, resume_id: int, experience_id: int, 
                              description: str, display_order: Optional[int] = None) -> int:
         """Add a job accomplishment."""
-        self.connect()
-        try:
-            query = """
-            INSERT INTO job_accomplishments (
-                resume_id, experience_id, description,
-                display_order, is_visible, updated_at
-            ) VALUES (?, ?, ?, ?, 1, CURRENT_TIMESTAMP)
-            """
-            self.cursor.execute(query, (resume_id, experience_id, description, display_order))
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            cursor.execute(INSERT_ACCOMPLISHMENT, (resume_id, experience_id, description, display_order))
+            conn.commit()
+            return cursor.lastrowid
 
     def add_project(self, resume_id: int, data: Dict[str, Any]) -> int:
         """Add a project to a resume."""
-        self.connect()
-        try:
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
             query = """
             INSERT INTO projects (
                 resume_id, title, technologies, link,
@@ -229,24 +219,176 @@ class ResumeRepository:
                 data.get('is_visible', 1),
                 data.get('display_order', 0)
             )
-            self.cursor.execute(query, params)
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            cursor.execute(query, params)
+            conn.commit()
+            return cursor.lastrowid
+
+    def save_sections(self, resume_id: int, sections: Dict[str, Any],
+                      fingerprints: Optional[Dict[str, str]] = None,
+                      replace: bool = False) -> Dict[str, List[int]]:
+        """
+        Write a set of generated sections of a resume in one transaction.
+
+        Each table's rows are inserted with a single executemany, and the
+        sections' fingerprints and 'complete' statuses are committed with
+        them, so the sections are stored atomically with one commit instead
+        of one per row.
+
+        Args:
+            resume_id: Resume the sections belong to
+            sections: Section name -> data. The summary is its text; the other
+                sections are lists of row dicts as taken by the add_* methods,
+                with skill categories holding their skill dicts under 'skills'
+                and experiences their accomplishment texts under 'accomplishments'
+            fingerprints: Input fingerprint of each section, recorded with it
+            replace: Delete the sections' existing rows first
+
+        Returns:
+            Dict[str, List[int]]: Table name -> IDs of the inserted rows, in input order
+        """
+        unknown = set(sections) - set(BATCH_SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown resume sections: {', '.join(sorted(unknown))}")
+
+        ids: Dict[str, List[int]] = {}
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            if replace:
+                for section in sections:
+                    for table in SECTION_TABLES[section]:
+                        cursor.execute(f"DELETE FROM {table} WHERE resume_id = ?", (resume_id,))
+
+            if "summary" in sections:
+                ids["summary"] = self._insert_many(cursor, """
+                INSERT INTO summary (resume_id, content, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                """, [(resume_id, sections["summary"])])
+
+            if "skills" in sections:
+                categories = sections["skills"]
+                ids["skill_categories"] = self._insert_many(cursor, """
+                INSERT INTO skill_categories (
+                    resume_id, name, display_order, is_visible, updated_at
+                ) VALUES (?, ?, ?, 1, CURRENT_TIMESTAMP)
+                """, [
+                    (resume_id, category['name'], category.get('display_order', idx))
+                    for idx, category in enumerate(categories)
+                ])
+                ids["skills"] = self._insert_many(cursor, """
+                INSERT INTO skills (
+                    resume_id, category_id, name, proficiency,
+                    is_visible, display_order, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, [
+                    (resume_id, category_id, skill['name'], skill.get('proficiency'),
+                     skill.get('is_visible', 1), skill.get('display_order', idx))
+                    for category_id, category in zip(ids["skill_categories"], categories)
+                    for idx, skill in enumerate(category.get('skills', []))
+                ])
+
+            if "experience" in sections:
+                experiences = sections["experience"]
+                ids["experience"] = self._insert_many(cursor, """
+                INSERT INTO experience (
+                    resume_id, job_title, company, location,
+                    date_range, is_visible, display_order, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, [
+                    (resume_id, data['job_title'], data['company'], data.get('location'),
+                     data.get('date_range'), data.get('is_visible', 1), data.get('display_order', idx))
+                    for idx, data in enumerate(experiences)
+                ])
+                ids["job_accomplishments"] = self._insert_many(cursor, INSERT_ACCOMPLISHMENT, [
+                    (resume_id, exp_id, desc, idx)
+                    for exp_id, data in zip(ids["experience"], experiences)
+                    for idx, desc in enumerate(data.get('accomplishments') or [])
+                ])
+
+            if "education" in sections:
+                ids["education"] = self._insert_many(cursor, """
+                INSERT INTO education (
+                    resume_id, degree, institution, location,
+                    date_range, description, is_visible, display_order,
+                    updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, [
+                    (resume_id, data['degree'], data['institution'], data.get('location'),
+                     data.get('date_range'), data.get('description'),
+                     data.get('is_visible', 1), data.get('display_order', idx))
+                    for idx, data in enumerate(sections["education"])
+                ])
+
+            if "projects" in sections:
+                ids["projects"] = self._insert_many(cursor, """
+                INSERT INTO projects (
+                    resume_id, title, technologies, link,
+                    description, is_visible, display_order, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, [
+                    (resume_id, data['title'], data.get('technologies'), data.get('link'),
+                     data.get('description'), data.get('is_visible', 1), data.get('display_order', idx))
+                    for idx, data in enumerate(sections["projects"])
+                ])
+
+            if fingerprints:
+                cursor.executemany("""
+                INSERT OR REPLACE INTO resume_sections (resume_id, section, fingerprint, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                """, [(resume_id, section, fingerprints[section]) for section in sections])
+            cursor.executemany("""
+            INSERT OR REPLACE INTO resume_section_status (resume_id, section, status, error, updated_at)
+            VALUES (?, ?, 'complete', NULL, CURRENT_TIMESTAMP)
+            """, [(resume_id, section) for section in sections])
+            conn.commit()
+        return ids
+
+    def _insert_many(self, cursor, query: str, rows: List[tuple]) -> List[int]:
+        """Insert rows with one executemany and return their IDs."""
+        if not rows:
+            return []
+        cursor.executemany(query, rows)
+        # A new INTEGER PRIMARY KEY is the largest one plus one, so the rows of
+        # one executemany inside a write transaction get consecutive IDs
+        last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(rows) + 1, last_id + 1))
 
     def get_resume_by_job_id(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get resume by job ID."""
-        self.connect()
-        try:
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                query = """
+                SELECT id, name, description, job_id, created_at, updated_at
+                FROM resumes
+                WHERE job_id = ?
+                """
+                cursor.execute(query, (job_id,))
+                row = cursor.fetchone()
+                if row:
+                    return {
+                        "id": row[0],
+                        "name": row[1],
+                        "description": row[2],
+                        "job_id": row[3],
+                        "created_at": row[4],
+                        "updated_at": row[5]
+                    }
+                return None
+            except Exception as e:
+                print(f"Error getting resume by job ID: {e}")
+                return None
+
+    def get_resume(self, resume_id: int) -> Optional[Dict[str, Any]]:
+        """Get resume by ID."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
             query = """
             SELECT id, name, description, job_id, created_at, updated_at
             FROM resumes
-            WHERE job_id = ?
+            WHERE id = ?
             """
-            self.cursor.execute(query, (job_id,))
-            row = self.cursor.fetchone()
+            cursor.execute(query, (resume_id,))
+            row = cursor.fetchone()
             if row:
                 return {
                     "id": row[0],
@@ -257,6 +399,228 @@ class ResumeRepository:
                     "updated_at": row[5]
                 }
             return None
-        except Exception as e:
-            print(f"Error getting resume by job ID: {e}")
+
+    def get_full_resume(self, resume_id: int) -> Optional[FullResume]:
+        """Get a resume with every visible section, see get_full_resumes."""
+        resumes = self.get_full_resumes([resume_id])
+        return resumes[0] if resumes else None
+
+    def get_full_resumes(self, resume_ids: List[int]) -> List[FullResume]:
+        """
+        Get resumes with every visible section, in display order.
+
+        Each table is read once for all the resumes, so the number of queries
+        is fixed however many resumes and rows there are, and all of them
+        read the same snapshot of the database.
+
+        Args:
+            resume_ids: Resumes to load
+
+        Returns:
+            List[FullResume]: The resumes that exist, in the order of resume_ids
+        """
+        if not resume_ids:
+            return []
+        # One JSON array parameter instead of one placeholder per ID, so
+        # large batches stay under SQLite's bound-variable limit
+        ids = json.dumps([int(resume_id) for resume_id in resume_ids])
+        in_ids = "resume_id IN (SELECT value FROM json_each(?))"
+
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN")
+            cursor.execute("""
+            SELECT id, name, description, job_id, created_at, updated_at
+            FROM resumes WHERE id IN (SELECT value FROM json_each(?))
+            """, (ids,))
+            resumes = {row['id']: row for row in cursor.fetchall()}
+
+            def rows(query: str) -> Dict[int, List[Any]]:
+                cursor.execute(query, (ids,))
+                grouped = defaultdict(list)
+                for row in cursor.fetchall():
+                    grouped[row['resume_id']].append(row)
+                return grouped
+
+            personal_info = rows(f"SELECT * FROM resume_personal_info WHERE {in_ids}")
+            contact_details = rows(f"""
+            SELECT * FROM resume_personal_info_details WHERE {in_ids}
+            ORDER BY resume_id, display_order
+            """)
+            summaries = rows(f"SELECT resume_id, content FROM summary WHERE {in_ids} ORDER BY id")
+            categories = rows(f"""
+            SELECT * FROM skill_categories WHERE {in_ids} AND is_visible = 1
+            ORDER BY resume_id, display_order, id
+            """)
+            skills = rows(f"""
+            SELECT * FROM skills WHERE {in_ids} AND is_visible = 1
+            ORDER BY resume_id, display_order, id
+            """)
+            experiences = rows(f"""
+            SELECT * FROM experience WHERE {in_ids} AND is_visible = 1
+            ORDER BY resume_id, display_order, id
+            """)
+            accomplishments = rows(f"""
+            SELECT * FROM job_accomplishments WHERE {in_ids} AND is_visible = 1
+            ORDER BY resume_id, display_order, id
+            """)
+            education = rows(f"""
+            SELECT * FROM education WHERE {in_ids} AND is_visible = 1
+            ORDER BY resume_id, display_order, id
+            """)
+            projects = rows(f"""
+            SELECT * FROM projects WHERE {in_ids} AND is_visible = 1
+            ORDER BY resume_id, display_order, id
+            """)
+            conn.commit()
+
+        full_resumes = []
+        for resume_id in resume_ids:
+            resume = resumes.get(resume_id)
+            if resume is None:
+                continue
+
+            skills_by_category = defaultdict(list)
+            for skill in skills[resume_id]:
+                skills_by_category[skill['category_id']].append(
+                    Skill(name=skill['name'], proficiency=skill['proficiency'])
+                )
+            accomplishments_by_experience = defaultdict(list)
+            for accomplishment in accomplishments[resume_id]:
+                accomplishments_by_experience[accomplishment['experience_id']].append(
+                    accomplishment['description']
+                )
+
+            info = personal_info[resume_id][0] if personal_info[resume_id] else None
+            full_resumes.append(FullResume(
+                id=resume['id'],
+                name=resume['name'],
+                job_id=resume['job_id'],
+                description=resume['description'],
+                created_at=resume['created_at'],
+                updated_at=resume['updated_at'],
+                personal_info=PersonalInfo(
+                    name=info['name'],
+                    contact_info=info['contact_info'],
+                    contact_details=[
+                        PersonalInfoDetail(
+                            detail_name=detail['detail_name'],
+                            detail_icon=detail['detail_icon'],
+                            detail_info=detail['detail_info']
+                        )
+                        for detail in contact_details[resume_id]
+                    ]
+                ) if info else None,
+                summary=summaries[resume_id][0]['content'] if summaries[resume_id] else None,
+                skills=[
+                    SkillCategory(name=category['name'], skills=skills_by_category[category['id']])
+                    for category in categories[resume_id]
+                ],
+                experience=[
+                    Experience(
+                        job_title=exp['job_title'],
+                        company=exp['company'],
+                        location=exp['location'],
+                        date_range=exp['date_range'],
+                        display_order=exp['display_order'] or 0,
+                        accomplishments=accomplishments_by_experience[exp['id']]
+                    )
+                    for exp in experiences[resume_id]
+                ],
+                education=[
+                    Education(
+                        degree=edu['degree'],
+                        institution=edu['institution'],
+                        location=edu['location'],
+                        date_range=edu['date_range'],
+                        description=edu['description']
+                    )
+                    for edu in education[resume_id]
+                ],
+                projects=[
+                    Project(
+                        title=project['title'],
+                        technologies=project['technologies'],
+                        link=project['link'],
+                        description=project['description']
+                    )
+                    for project in projects[resume_id]
+                ]
+            ))
+        return full_resumes
+
+    def touch_resume(self, resume_id: int) -> None:
+        """Set a resume's updated_at to now."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE resumes SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (resume_id,)
+            )
+            conn.commit()
+
+    def delete_section(self, resume_id: int, section: str) -> None:
+        """Delete every row of one section of a resume."""
+        if section not in SECTION_TABLES:
+            raise ValueError(f"Unknown resume section: {section}")
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            for table in SECTION_TABLES[section]:
+                cursor.execute(f"DELETE FROM {table} WHERE resume_id = ?", (resume_id,))
+            conn.commit()
+
+    def set_resume_source(self, resume_id: int, company_id: int, background_hash: str) -> None:
+        """Record the job analysis and background a resume was generated from."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            query = """
+            INSERT OR REPLACE INTO resume_sources (resume_id, company_id, background_hash, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """
+            cursor.execute(query, (resume_id, company_id, background_hash))
+            conn.commit()
+
+    def get_resume_source(self, resume_id: int) -> Optional[Dict[str, Any]]:
+        """Get the job analysis and background a resume was generated from."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT company_id, background_hash FROM resume_sources WHERE resume_id = ?",
+                (resume_id,)
+            )
+            row = cursor.fetchone()
+            if row:
+                return {"company_id": row[0], "background_hash": row[1]}
             return None
+
+    def set_section_status(self, resume_id: int, sections: List[str], status: str,
+                           error: Optional[str] = None) -> None:
+        """Record the generation status ('pending', 'complete' or 'failed') of resume sections."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            query = """
+            INSERT OR REPLACE INTO resume_section_status (resume_id, section, status, error, updated_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """
+            cursor.executemany(query, [(resume_id, section, status, error) for section in sections])
+            conn.commit()
+
+    def get_section_statuses(self, resume_id: int) -> Dict[str, str]:
+        """Get the generation status of each section of a resume."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT section, status FROM resume_section_status WHERE resume_id = ?",
+                (resume_id,)
+            )
+            return {section: status for section, status in cursor.fetchall()}
+
+    def get_section_fingerprints(self, resume_id: int) -> Dict[str, str]:
+        """Get the stored input fingerprint of each section of a resume."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT section, fingerprint FROM resume_sections WHERE resume_id = ?",
+                (resume_id,)
+            )
+            return {section: fingerprint for section, fingerprint in cursor.fetchall()}
@@ -0,0 +1,129 @@
+from typing import Dict, List
+import sqlite3
+from app.db.connection import get_connection_manager, reads, writes
+
+class SkillRepository:
+    def __init__(self, db_path: str):
+        """Initialize repository with database path."""
+        self.db_path = db_path
+        self.connections = get_connection_manager(db_path)
+
+    def _skill_ids(self, cursor: sqlite3.Cursor, names: List[str]) -> Dict[str, int]:
+        """Get canonical skill IDs by name, adding the names that are new."""
+        cursor.executemany(
+            "INSERT OR IGNORE INTO canonical_skills (name) VALUES (?)",
+            [(name,) for name in names]
+        )
+        placeholders = ", ".join("?" for _ in names)
+        cursor.execute(f"SELECT id, name FROM canonical_skills WHERE name IN ({placeholders})", names)
+        return {row['name']: row['id'] for row in cursor.fetchall()}
+
+    @writes
+    def set_job_skills(self, job_id: str, skills: Dict[str, str]) -> None:
+        """Replace a job's skills; skills maps canonical name to 'required' or 'preferred'."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM job_skills WHERE job_id = ?", (job_id,))
+            if skills:
+                skill_ids = self._skill_ids(cursor, list(skills))
+                cursor.executemany(
+                    "INSERT INTO job_skills (job_id, skill_id, requirement) VALUES (?, ?, ?)",
+                    [(job_id, skill_ids[name], requirement) for name, requirement in skills.items()]
+                )
+            conn.commit()
+
+    @writes
+    def set_candidate_skills(self, background_hash: str, skills: List[str]) -> None:
+        """Replace the skills of a parsed background."""
+        with self.connections.writing() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM candidate_skills WHERE background_hash = ?", (background_hash,))
+            if skills:
+                skill_ids = self._skill_ids(cursor, skills)
+                cursor.executemany(
+                    "INSERT INTO candidate_skills (background_hash, skill_id) VALUES (?, ?)",
+                    [(background_hash, skill_ids[name]) for name in skills]
+                )
+            conn.commit()
+
+    @reads
+    def get_analyzed_jobs(self) -> Dict[str, str]:
+        """Get the required_skills text of each job's most recent analysis, by job ID."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            query = """
+            SELECT ja.job_id, c.required_skills
+            FROM job_analyses ja
+            JOIN company c ON c.id = ja.company_id
+            ORDER BY ja.created_at
+            """
+            cursor.execute(query)
+            # Later analyses overwrite earlier ones
+            return {row['job_id']: row['required_skills'] for row in cursor.fetchall()}
+
+    @reads
+    def get_job_skills(self, job_id: str) -> Dict[str, str]:
+        """Get a job's skills as canonical name -> 'required' or 'preferred'."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            query = """
+            SELECT cs.name, js.requirement
+            FROM job_skills js
+            JOIN canonical_skills cs ON cs.id = js.skill_id
+            WHERE js.job_id = ?
+            """
+            cursor.execute(query, (job_id,))
+            return {row['name']: row['requirement'] for row in cursor.fetchall()}
+
+    @reads
+    def get_candidate_skills(self, background_hash: str) -> List[str]:
+        """Get the canonical skill names of a parsed background."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            query = """
+            SELECT cs.name
+            FROM candidate_skills c
+            JOIN canonical_skills cs ON cs.id = c.skill_id
+            WHERE c.background_hash = ?
+            """
+            cursor.execute(query, (background_hash,))
+            return [row['name'] for row in cursor.fetchall()]
+
+    @reads
+    def get_jobs_missing_skill(self, skill: str, background_hash: str) -> List[Dict]:
+        """Get the jobs asking for a skill the background lacks, required ones first."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            query = """
+            SELECT j.id, j.title, j.company, j.applied, js.requirement
+            FROM canonical_skills cs
+            JOIN job_skills js ON js.skill_id = cs.id
+            JOIN jobs j ON j.id = js.job_id
+            WHERE cs.name = ?
+              AND NOT EXISTS (
+                  SELECT 1 FROM candidate_skills c
+                  WHERE c.background_hash = ? AND c.skill_id = cs.id
+              )
+            ORDER BY js.requirement = 'preferred', j.scraped_date DESC
+            """
+            cursor.execute(query, (skill, background_hash))
+            return [dict(row) for row in cursor.fetchall()]
+
+    @reads
+    def get_match_counts(self, background_hash: str) -> List[Dict]:
+        """Get, per indexed job, how many required/preferred skills a background has."""
+        with self.connections.connection() as conn:
+            cursor = conn.cursor()
+            query = """
+            SELECT js.job_id,
+                   SUM(js.requirement = 'required') AS required_total,
+                   SUM(js.requirement = 'required' AND c.skill_id IS NOT NULL) AS required_matched,
+                   SUM(js.requirement = 'preferred') AS preferred_total,
+                   SUM(js.requirement = 'preferred' AND c.skill_id IS NOT NULL) AS preferred_matched
+            FROM job_skills js
+            LEFT JOIN candidate_skills c
+                ON c.skill_id = js.skill_id AND c.background_hash = ?
+            GROUP BY js.job_id
+            """
+            cursor.execute(query, (background_hash,))
+            return [dict(row) for row in cursor.fetchall()]
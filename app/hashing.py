@@ -0,0 +1,13 @@
+"""Helpers for building stable content hashes used as cache keys."""
+import hashlib
+
+
+def content_hash(*parts: str) -> str:
+    """Return a SHA-256 hex digest over the given string parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        # Length-prefix each part so ("ab", "c") and ("a", "bc") differ
+        encoded = (part or "").encode("utf-8")
+        digest.update(str(len(encoded)).encode("ascii") + b":")
+        digest.update(encoded)
+    return digest.hexdigest()
@@ -0,0 +1,119 @@
+"""
+Per-stage latency and token instrumentation for the resume pipeline.
+
+The active ResumeReport and stage are tracked in context variables, so
+stages timed inside concurrently running tasks are attributed to the job
+(and stage) that started them.
+"""
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from app.models import BatchReport, ResumeReport, StageMetrics, StageSummary
+
+_current_report: ContextVar[Optional[ResumeReport]] = ContextVar("current_report", default=None)
+_current_stage: ContextVar[Optional[StageMetrics]] = ContextVar("current_stage", default=None)
+
+
+def current_report() -> Optional[ResumeReport]:
+    """The report stages are currently recorded into, if any."""
+    return _current_report.get()
+
+
+@contextmanager
+def recording(report: ResumeReport) -> Iterator[ResumeReport]:
+    """Record every stage timed inside the block into report."""
+    token = _current_report.set(report)
+    start = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report.total_ms += (time.perf_counter() - start) * 1000
+        _current_report.reset(token)
+
+
+@contextmanager
+def track_stage(name: str) -> Iterator[StageMetrics]:
+    """Time a pipeline stage and attach it to the active report."""
+    stage = StageMetrics(stage=name)
+    report = _current_report.get()
+    if report is not None:
+        report.stages.append(stage)
+    token = _current_stage.set(stage)
+    start = time.perf_counter()
+    try:
+        yield stage
+    finally:
+        stage.wall_ms += (time.perf_counter() - start) * 1000
+        _current_stage.reset(token)
+
+
+def record_usage(result: Any) -> None:
+    """Add the token usage of an agent run result to the active stage."""
+    stage = _current_stage.get()
+    if stage is None:
+        return
+    if getattr(result, "cached", False):
+        stage.cached = True
+        return
+
+    usage = result.usage() if hasattr(result, "usage") else None
+    if usage is None:
+        return
+    requests = usage.requests or 0
+    stage.llm_requests += requests
+    stage.request_tokens += usage.request_tokens or 0
+    stage.response_tokens += usage.response_tokens or 0
+    # pydantic-ai re-prompts the model when output validation fails
+    stage.retries += max(requests - 1, 0)
+
+
+def record_retry(count: int = 1) -> None:
+    """Count a retried request against the active stage."""
+    stage = _current_stage.get()
+    if stage is not None:
+        stage.retries += count
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_reports(reports: Iterable[ResumeReport]) -> BatchReport:
+    """Aggregate resume reports into per-stage p50/p95 latency and token totals."""
+    reports = list(reports)
+    by_stage: Dict[str, List[StageMetrics]] = {}
+    for report in reports:
+        for stage in report.stages:
+            by_stage.setdefault(stage.stage, []).append(stage)
+
+    stages = []
+    for name, metrics in by_stage.items():
+        wall_times = [metric.wall_ms for metric in metrics]
+        stages.append(StageSummary(
+            stage=name,
+            count=len(metrics),
+            p50_ms=percentile(wall_times, 50),
+            p95_ms=percentile(wall_times, 95),
+            max_ms=max(wall_times),
+            request_tokens=sum(metric.request_tokens for metric in metrics),
+            response_tokens=sum(metric.response_tokens for metric in metrics),
+            retries=sum(metric.retries for metric in metrics)
+        ))
+    # Slowest stages first, so the bottleneck is at the top
+    stages.sort(key=lambda summary: summary.p95_ms, reverse=True)
+
+    totals = [report.total_ms for report in reports]
+    return BatchReport(
+        resumes=len(reports),
+        p50_total_ms=percentile(totals, 50),
+        p95_total_ms=percentile(totals, 95),
+        stages=stages
+    )
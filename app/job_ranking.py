@@ -0,0 +1,88 @@
+"""
+Local relevance pre-ranking of jobs against the candidate background.
+
+Every description and the background are turned into hashed bag-of-words
+TF-IDF vectors in one matrix, and each job is scored by its cosine
+similarity to the background with a single matrix-vector product. No LLM
+calls are made, so the ranking decides where the LLM budget goes first.
+"""
+import hashlib
+import re
+from typing import List, Optional, Tuple
+
+from app.config import JOB_RANKING_FEATURES
+from app.models import Job
+
+_TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#.]*[a-z0-9+#]|[a-z]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens, keeping terms like c++, c#, node.js."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _feature_index(token: str, features: int) -> int:
+    # A stable hash: the built-in hash() of str is salted per process
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big") % features
+
+
+def relevance_scores(descriptions: List[str], my_background: str,
+                     features: int = JOB_RANKING_FEATURES):
+    """
+    Cosine similarity of each description to the background.
+
+    Args:
+        descriptions: Job descriptions to score
+        my_background: Free-text background of the candidate
+        features: Number of hashed term buckets
+
+    Returns:
+        numpy.ndarray: One score in [0, 1] per description
+    """
+    # Deferred: NumPy is only needed when jobs are actually ranked
+    import numpy as np
+
+    documents = list(descriptions) + [my_background]
+    # Flat (document, feature) cell of every token occurrence, counted in one pass
+    cells = [
+        row * features + _feature_index(token, features)
+        for row, text in enumerate(documents)
+        for token in tokenize(text)
+    ]
+    counts = np.bincount(
+        np.array(cells, dtype=np.int64), minlength=len(documents) * features
+    ).reshape(len(documents), features).astype(np.float32)
+
+    # Sublinear term frequency, smoothed inverse document frequency
+    tf = np.log1p(counts)
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+    vectors = tf * idf.astype(np.float32)
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= np.where(norms == 0, 1, norms)
+    return vectors[:-1] @ vectors[-1]
+
+
+def rank_jobs(jobs: List[Job], my_background: str, min_score: Optional[float] = None,
+              features: int = JOB_RANKING_FEATURES) -> List[Tuple[Job, float]]:
+    """
+    Order jobs by relevance to the background, best match first.
+
+    Args:
+        jobs: Jobs to rank
+        my_background: Free-text background of the candidate
+        min_score: Drop jobs scoring below this cosine similarity
+        features: Number of hashed term buckets
+
+    Returns:
+        List[Tuple[Job, float]]: (job, score) pairs in descending score order;
+            ties keep their input order
+    """
+    if not jobs:
+        return []
+    scores = relevance_scores([job.description for job in jobs], my_background, features)
+    ranked = sorted(zip(jobs, (float(score) for score in scores)), key=lambda pair: -pair[1])
+    if min_score is not None:
+        ranked = [(job, score) for job, score in ranked if score >= min_score]
+    return ranked
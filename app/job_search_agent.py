@@ -6,16 +6,40 @@ from pathlib import Path
 import asyncio
 from .models import Job
 from .db.job_repository import JobRepository
-from openai import AsyncOpenAI
-from .config import DATABASE_PATH
+from .config import (
+    DATABASE_PATH, LLM_CACHE_ENABLED, LLM_PROVIDER, LLM_RESPONSE_TOKEN_ESTIMATE,
+    NEAR_DUPLICATE_DETECTION, OFFLINE_LATENCY_SECONDS
+)
+from .llm_cache import LLMCache
+from .llm_scheduler import LLMScheduler, get_scheduler
+from .near_duplicates import NearDuplicateIndex
+from .offline_model import OFFLINE_MODEL_NAME, offline_search_queries
+from .prompt_compaction import estimate_tokens
 
 class JobSearchAgent:
-    def __init__(self, api_key: str = None):
+    # Model and system prompt used to generate search queries
+    model = "gpt-4"
+    system_prompt = "You are a job search expert who creates optimized search queries."
+
+    def __init__(self, api_key: str = None, llm_cache: Optional[LLMCache] = None,
+                 provider: str = LLM_PROVIDER, scheduler: Optional[LLMScheduler] = None):
         """Initialize the Job Search Agent"""
-        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required")
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        if provider not in ("openai", "offline"):
+            raise ValueError(f"Unknown LLM provider: {provider}")
+        self.provider = provider
+        self.client = None
+        if provider == "openai":
+            self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+            if not self.api_key:
+                raise ValueError("OpenAI API key is required")
+            from openai import AsyncOpenAI  # deferred: slow to import
+            self.client = AsyncOpenAI(api_key=self.api_key)
+        else:
+            self.model = OFFLINE_MODEL_NAME
+        if llm_cache is None and LLM_CACHE_ENABLED:
+            llm_cache = LLMCache(DATABASE_PATH)
+        self.llm_cache = llm_cache
+        self.scheduler = scheduler or get_scheduler()
 
     def read_file_content(self, file_path: str) -> str:
         """Read content from a file"""
@@ -59,26 +83,49 @@ class JobSearchAgent:
         """
 
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[{
-                    "role": "system",
-                    "content": "You are a job search expert who creates optimized search queries."
-                }, {
-                    "role": "user",
-                    "content": prompt
-                }],
-                temperature=0.7,
+            # Replay the queries from an identical earlier request if cached
+            cache_key = None
+            if self.llm_cache is not None:
+                cache_key = self.llm_cache.make_key(self.model, self.system_prompt, prompt, "json")
+                cached = await self.llm_cache.get(cache_key)
+                if cached is not None:
+                    return json.loads(cached)
+
+            content = await self.scheduler.submit(
+                lambda: self._complete(prompt),
+                estimated_tokens=estimate_tokens(self.system_prompt) + estimate_tokens(prompt)
+                + LLM_RESPONSE_TOKEN_ESTIMATE
             )
 
             # Parse and validate the response
-            queries = json.loads(response.choices[0].message.content)
+            queries = json.loads(content)
+            if cache_key is not None:
+                await self.llm_cache.put(cache_key, content)
             return queries
 
         except Exception as e:
             print(f"Error generating search queries: {e}")
             return []
 
+    async def _complete(self, prompt: str) -> str:
+        """Send one chat completion request and return the response text."""
+        if self.provider == "offline":
+            await asyncio.sleep(OFFLINE_LATENCY_SECONDS)
+            return offline_search_queries(prompt)
+
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{
+                "role": "system",
+                "content": self.system_prompt
+            }, {
+                "role": "user",
+                "content": prompt
+            }],
+            temperature=0.7,
+        )
+        return response.choices[0].message.content
+
     async def execute_job_search(self, queries: List[Dict], scraper) -> List[Job]:
         """Execute job searches using the generated queries"""
         all_jobs = []
@@ -116,7 +163,8 @@ class JobSearchAgent:
         return all_jobs
 
     async def save_jobs_to_database(self, jobs: List[Dict], job_repo: JobRepository) -> int:
-        """Save unique jobs to the database"""
+        """Save unique jobs to the database and index them for near-duplicate detection"""
+        near_duplicates = NearDuplicateIndex(job_repo.db_path) if NEAR_DUPLICATE_DETECTION else None
         saved_count = 0
         for job_data in jobs:
             job = Job(
@@ -134,6 +182,11 @@ class JobSearchAgent:
             if await job_repo.create(job):
                 saved_count += 1
                 print(f"Added new job: {job.title} at {job.company}")
+                if near_duplicates is not None:
+                    match = await near_duplicates.find(job.description, exclude_job_id=job.id)
+                    await near_duplicates.add(job.id, job.description)
+                    if match:
+                        print(f"  Near-duplicate of job {match[0]} ({match[1]:.0%} similar); its analysis and resume will be reused")
             else:
                 print(f"Job already exists: {job.title} at {job.company}")
 
@@ -0,0 +1,129 @@
+"""Content-addressed cache for LLM responses."""
+import json
+import time
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from app.config import (
+    LLM_CACHE_MAX_BYTES, LLM_CACHE_TOUCH_BATCH, LLM_CACHE_TOUCH_INTERVAL_SECONDS, LLM_CACHE_TTL_SECONDS
+)
+from app.db.llm_cache_repository import LLMCacheRepository
+from app.hashing import content_hash
+from app.single_flight import SingleFlight
+
+
+class LLMCache:
+    """
+    SQLite-backed cache of LLM responses.
+
+    Entries are keyed by model, system prompt, user prompt and output schema,
+    expire after ttl_seconds, and are evicted least-recently-used first once
+    their total size exceeds max_bytes. A hit is a plain read; access times
+    for the LRU order are collected and written in one batch before the
+    next eviction, once LLM_CACHE_TOUCH_BATCH are pending, and on close().
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = LLM_CACHE_MAX_BYTES,
+                 ttl_seconds: float = LLM_CACHE_TTL_SECONDS):
+        self.repo = LLMCacheRepository(db_path)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Access times of hits not yet written, by cache key
+        self._accessed: Dict[str, float] = {}
+        # Identical requests already on their way to the LLM, by cache key
+        self.in_flight = SingleFlight()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: Any, output_schema: Any) -> str:
+        """Build the cache key for a single LLM request."""
+        if not isinstance(user_prompt, str):
+            user_prompt = json.dumps(user_prompt, sort_keys=True, default=str)
+        if isinstance(output_schema, type) and issubclass(output_schema, BaseModel):
+            output_schema = output_schema.model_json_schema()
+        if not isinstance(output_schema, str):
+            output_schema = json.dumps(output_schema, sort_keys=True)
+        return content_hash(model, system_prompt, user_prompt, output_schema)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached response, or None on a miss."""
+        now = time.time()
+        entry = await self.repo.get(key, min_created_at=now - self.ttl_seconds)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if now - entry["last_accessed"] >= LLM_CACHE_TOUCH_INTERVAL_SECONDS:
+            self._accessed[key] = now
+            if len(self._accessed) >= LLM_CACHE_TOUCH_BATCH:
+                await self.flush()
+        return entry["value"]
+
+    async def put(self, key: str, value: str) -> None:
+        """Store a response and evict entries beyond the size budget."""
+        now = time.time()
+        await self.repo.put(key, value, now=now)
+        # Recorded hits first, so eviction sees the current LRU order
+        await self.flush()
+        self.evictions += await self.repo.evict(self.max_bytes, min_created_at=now - self.ttl_seconds)
+
+    async def flush(self) -> None:
+        """Write the access times recorded by hits since the last flush."""
+        if self._accessed:
+            accessed, self._accessed = self._accessed, {}
+            await self.repo.touch(accessed)
+
+    async def close(self) -> None:
+        """Write pending access times; call once the cache is no longer used."""
+        await self.flush()
+
+    async def clear(self) -> None:
+        """Delete every cached response."""
+        self._accessed = {}
+        await self.repo.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss, eviction and coalesced-miss counters since this cache was created."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "coalesced": self.in_flight.coalesced}
+
+
+class CachedRunResult:
+    """Stand-in for an agent run result that was served from the cache."""
+
+    cached = True
+
+    def __init__(self, output: BaseModel):
+        self.output = output
+
+
+class CachedAgent:
+    """Wraps a pydantic-ai Agent so identical runs are replayed from an LLMCache."""
+
+    def __init__(self, agent: Any, cache: LLMCache, model: str, system_prompt: str,
+                 output_type: Type[BaseModel]):
+        self.agent = agent
+        self.cache = cache
+        self.model = model
+        self.system_prompt = system_prompt
+        self.output_type = output_type
+
+    async def run(self, user_prompt: Any) -> Any:
+        """Run the agent, or replay the cached or in-flight output of an identical request."""
+        key = self.cache.make_key(self.model, self.system_prompt, user_prompt, self.output_type)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return CachedRunResult(self.output_type.model_validate_json(cached))
+
+        async def run_and_store():
+            result = await self.agent.run(user_prompt)
+            await self.cache.put(key, result.output.model_dump_json())
+            return result
+
+        # Concurrent identical misses share one LLM request; callers that
+        # joined it did not spend tokens, so they see a cache-style result
+        result, shared = await self.cache.in_flight.do_shared(key, run_and_store)
+        return CachedRunResult(result.output) if shared else result
@@ -0,0 +1,237 @@
+"""
+Shared scheduler for outgoing LLM requests.
+
+Every agent call goes through LLMScheduler.submit, which keeps requests and
+tokens per minute under the configured budgets (token buckets), retries
+rate-limit and server errors with jittered exponential backoff, and opens a
+circuit after repeated failures so a failing API is not hammered.
+"""
+import asyncio
+import json
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from app.config import (
+    LLM_BACKOFF_BASE_SECONDS, LLM_BACKOFF_MAX_SECONDS, LLM_CIRCUIT_FAILURE_THRESHOLD,
+    LLM_CIRCUIT_RESET_SECONDS, LLM_MAX_RETRIES, LLM_REQUESTS_PER_MINUTE,
+    LLM_RESPONSE_TOKEN_ESTIMATE, LLM_TOKENS_PER_MINUTE
+)
+from app.instrumentation import record_retry
+from app.prompt_compaction import estimate_tokens
+
+T = TypeVar("T")
+
+# HTTP status codes worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the LLM while the circuit is open."""
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at rate_per_minute, holding up to capacity."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.level = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated_at) * self.rate_per_second)
+        self.updated_at = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until amount can be taken from the bucket, then take it."""
+        # A request larger than the bucket could never fit; let it drain the bucket instead
+        amount = min(amount, self.capacity)
+        while True:
+            # No await between the check and the decrement, so this is atomic
+            # with respect to other coroutines on the event loop
+            self._refill()
+            if self.level >= amount:
+                self.level -= amount
+                return
+            await asyncio.sleep((amount - self.level) / self.rate_per_second)
+
+    def adjust(self, amount: float) -> None:
+        """Charge (positive) or refund (negative) tokens after the fact; may go into debt."""
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures and rejects calls for
+    reset_seconds. It is then half-open: one trial call is let through while
+    the others keep being rejected, until the trial succeeds (closing the
+    circuit) or fails (re-opening it for another reset_seconds).
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are being rejected: cooling down, or a trial call is in flight."""
+        if self.opened_at is None:
+            return False
+        return self.trial_in_flight or time.monotonic() - self.opened_at < self.reset_seconds
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError while the circuit is open; the first call after the cooldown is the trial."""
+        if self.opened_at is None:
+            return
+        if self.is_open:
+            remaining = max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+            waiting_for = "a trial call in flight" if self.trial_in_flight else f"retry in {remaining:.0f}s"
+            raise CircuitOpenError(
+                f"LLM circuit open after {self.failures} consecutive failures; {waiting_for}"
+            )
+        self.trial_in_flight = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.failures >= self.failure_threshold:
+            # Re-opening after a failed trial call restarts the cooldown
+            self.opened_at = time.monotonic()
+
+    def release_trial(self) -> None:
+        """End a trial call that neither succeeded nor failed transiently, so another can be let through."""
+        self.trial_in_flight = False
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an LLM call error is transient (rate limit, server or connection error)."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+    # openai.APIConnectionError / APITimeoutError carry no status code
+    return isinstance(error, (asyncio.TimeoutError, ConnectionError)) or \
+        type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Delay requested by the server through a Retry-After header, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMScheduler:
+    """Applies rate budgets, retries with backoff and circuit breaking to LLM calls."""
+
+    def __init__(self, requests_per_minute: float = LLM_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = LLM_TOKENS_PER_MINUTE,
+                 max_retries: int = LLM_MAX_RETRIES,
+                 backoff_base: float = LLM_BACKOFF_BASE_SECONDS,
+                 backoff_max: float = LLM_BACKOFF_MAX_SECONDS,
+                 failure_threshold: int = LLM_CIRCUIT_FAILURE_THRESHOLD,
+                 reset_seconds: float = LLM_CIRCUIT_RESET_SECONDS):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.circuit = CircuitBreaker(failure_threshold, reset_seconds)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def submit(self, call: Callable[[], Awaitable[T]], estimated_tokens: int = 0,
+                     actual_tokens: Optional[Callable[[T], Optional[int]]] = None) -> T:
+        """
+        Run call within the rate budgets, retrying transient failures.
+
+        Args:
+            call: Zero-argument coroutine factory performing one LLM request
+            estimated_tokens: Tokens charged to the tokens-per-minute budget up front
+            actual_tokens: Optional function returning the real token count of a
+                result, used to correct the up-front estimate
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            Exception: The last error once retries are exhausted, or any
+                non-retryable error immediately
+        """
+        attempt = 0
+        while True:
+            self.circuit.before_call()
+            try:
+                await self.request_bucket.acquire(1)
+                await self.token_bucket.acquire(estimated_tokens)
+                result = await call()
+            except BaseException as e:
+                if not isinstance(e, Exception) or not is_retryable(e):
+                    # Cancelled, or an error saying nothing about the API's health
+                    self.circuit.release_trial()
+                    raise
+                self.circuit.record_failure()
+                if attempt >= self.max_retries or self.circuit.is_open:
+                    raise
+                delay = _retry_after(e) or self.backoff_delay(attempt)
+                attempt += 1
+                record_retry()
+                await asyncio.sleep(delay)
+                continue
+
+            self.circuit.record_success()
+            if actual_tokens is not None:
+                used = actual_tokens(result)
+                if used is not None:
+                    self.token_bucket.adjust(used - estimated_tokens)
+            return result
+
+
+class ScheduledAgent:
+    """Wraps an agent so every run goes through an LLMScheduler."""
+
+    def __init__(self, agent: Any, scheduler: LLMScheduler, system_prompt: str = ""):
+        self.agent = agent
+        self.scheduler = scheduler
+        self.system_prompt = system_prompt
+
+    async def run(self, user_prompt: Any) -> Any:
+        prompt_text = user_prompt if isinstance(user_prompt, str) else json.dumps(user_prompt, default=str)
+        estimated = (estimate_tokens(self.system_prompt) + estimate_tokens(prompt_text)
+                     + LLM_RESPONSE_TOKEN_ESTIMATE)
+        return await self.scheduler.submit(
+            lambda: self.agent.run(user_prompt),
+            estimated_tokens=estimated,
+            actual_tokens=_usage_tokens
+        )
+
+
+def _usage_tokens(result: Any) -> Optional[int]:
+    """Total tokens reported by an agent run result, if available."""
+    usage = result.usage() if hasattr(result, "usage") else None
+    return getattr(usage, "total_tokens", None)
+
+
+_shared_scheduler: Optional[LLMScheduler] = None
+
+
+def get_scheduler() -> LLMScheduler:
+    """The process-wide scheduler shared by all agents."""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        _shared_scheduler = LLMScheduler()
+    return _shared_scheduler
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional, Dict
+from typing import Any, List, Literal, Optional, Dict
 from datetime import datetime
 
 class Skill(BaseModel):
@@ -113,6 +113,14 @@ class GeneratedProjects(BaseModel):
     """Model for AI-generated projects"""
     projects: List[Project]
 
+class GeneratedResume(BaseModel):
+    """Model for all AI-generated sections produced by a single compact-mode call"""
+    summary: GeneratedSummary
+    skills: GeneratedSkills
+    experience: GeneratedExperience
+    education: GeneratedEducation
+    projects: GeneratedProjects
+
 class JobAnalysis(BaseModel):
     """Model for analyzed job description data"""
     company_name: str = ""  # Name of the hiring company
@@ -133,3 +141,88 @@ class Job(BaseModel):
     application_url: Optional[str] = None
     applied: bool = False
     scraped_date: datetime
+
+class ResumeBatchResult(BaseModel):
+    """Model for the outcome of one job in a resume batch"""
+    job_id: str
+    company_id: Optional[int] = None
+    resume_id: Optional[int] = None
+    error: Optional[str] = None  # Set when the job failed; other jobs keep going
+    duplicate_of: Optional[str] = None  # Near-duplicate job whose analysis/resume was reused
+    report: Optional["ResumeReport"] = None
+
+class SkillMatch(BaseModel):
+    """Model for how a candidate's skills cover a job's required and preferred skills"""
+    job_id: str
+    score: float  # 0-1; preferred skills count PREFERRED_SKILL_WEIGHT of a required one
+    matched_required: List[str] = []
+    missing_required: List[str] = []
+    matched_preferred: List[str] = []
+    missing_preferred: List[str] = []
+
+class FullResume(BaseModel):
+    """Model for a stored resume with its visible sections in display order"""
+    id: int
+    name: str
+    job_id: Optional[str] = None
+    description: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    personal_info: Optional[PersonalInfo] = None
+    summary: Optional[str] = None
+    skills: List[SkillCategory] = []
+    experience: List[Experience] = []
+    education: List[Education] = []
+    projects: List[Project] = []
+
+class StageMetrics(BaseModel):
+    """Model for the measurements of one pipeline stage"""
+    stage: str  # e.g. 'analyze_job', 'generate_skills', 'save_sections'
+    wall_ms: float = 0.0
+    request_tokens: int = 0
+    response_tokens: int = 0
+    llm_requests: int = 0
+    retries: int = 0
+    cached: bool = False  # True when the LLM output was replayed from a cache
+
+class ResumeReport(BaseModel):
+    """Model for the per-stage measurements of one job's analysis and resume"""
+    job_id: Optional[str] = None
+    resume_id: Optional[int] = None
+    total_ms: float = 0.0
+    stages: List[StageMetrics] = []
+
+class StageSummary(BaseModel):
+    """Model for a stage aggregated over a batch of resume reports"""
+    stage: str
+    count: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    request_tokens: int
+    response_tokens: int
+    retries: int
+
+class BatchReport(BaseModel):
+    """Model for stage latency and token usage aggregated over a batch"""
+    resumes: int
+    p50_total_ms: float
+    p95_total_ms: float
+    stages: List[StageSummary]
+
+class ResumeEvent(BaseModel):
+    """Model for a progress event streamed while a resume is being built"""
+    type: Literal[
+        "analysis_done",     # Job analysis stored; data holds the analyzed company fields
+        "background_parsed", # Background parsed; data holds the ParsedBackground
+        "resume_created",    # Resume row and personal info stored
+        "section_ready",     # One section generated and stored; data holds its output
+        "resume_complete",   # Every section stored (or the resume already existed)
+    ]
+    job_id: str
+    company_id: Optional[int] = None
+    resume_id: Optional[int] = None
+    section: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+
+ResumeBatchResult.model_rebuild()
@@ -0,0 +1,118 @@
+"""
+Near-duplicate detection for job descriptions.
+
+LinkedIn reposts the same role under new IDs and across locations. Each
+description is reduced to a set of word shingles and a MinHash signature,
+whose bands are stored in an LSH index (the job_lsh_buckets table). Looking
+up a description only compares it against jobs sharing a band bucket, and a
+candidate counts as a duplicate when the estimated Jaccard similarity of the
+shingle sets reaches the threshold.
+"""
+import hashlib
+import random
+import re
+from typing import List, Optional, Set, Tuple
+
+from app.config import (
+    LSH_BANDS, MINHASH_PERMUTATIONS, NEAR_DUPLICATE_THRESHOLD, SHINGLE_SIZE
+)
+from app.db.job_signature_repository import JobSignatureRepository
+from app.hashing import content_hash
+
+# Mersenne prime modulus for the (a * x + b) mod p permutations
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Lowercased word shingles of text; short texts yield a single shingle."""
+    words = re.findall(r"\w+", text.lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+class MinHasher:
+    """MinHash signatures of shingle sets using num_perm seeded universal hashes."""
+
+    def __init__(self, num_perm: int = MINHASH_PERMUTATIONS, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.permutations = [
+            (rng.randint(1, _PRIME - 1), rng.randint(0, _PRIME - 1)) for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set: Set[str]) -> List[int]:
+        """Minimum permuted hash of the set under each permutation."""
+        hashes = [_shingle_hash(shingle) for shingle in shingle_set]
+        if not hashes:
+            return [_MAX_HASH] * self.num_perm
+        return [
+            min((a * h + b) % _PRIME for h in hashes) & _MAX_HASH
+            for a, b in self.permutations
+        ]
+
+
+def estimate_similarity(first: List[int], second: List[int]) -> float:
+    """Estimated Jaccard similarity of the sets behind two signatures."""
+    if len(first) != len(second) or not first:
+        return 0.0
+    return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+
+class NearDuplicateIndex:
+    """Persistent LSH index over job descriptions."""
+
+    def __init__(self, db_path: str, threshold: float = NEAR_DUPLICATE_THRESHOLD,
+                 num_perm: int = MINHASH_PERMUTATIONS, bands: int = LSH_BANDS):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self.repo = JobSignatureRepository(db_path)
+
+    def _buckets(self, signature: List[int]) -> List[str]:
+        # Bucket keys include the index shape, so changing num_perm or bands
+        # never matches buckets written with the old settings
+        shape = f"{self.hasher.num_perm}x{self.bands}"
+        return [
+            content_hash(shape, str(band), ",".join(map(str, signature[band * self.rows:(band + 1) * self.rows])))
+            for band in range(self.bands)
+        ]
+
+    async def add(self, job_id: str, description: str) -> None:
+        """Index a job's description; unchanged descriptions are not re-indexed."""
+        description_hash = content_hash(description)
+        if await self.repo.get_description_hash(job_id) == description_hash:
+            return
+        signature = self.hasher.signature(shingles(description))
+        await self.repo.save(job_id, description_hash, signature, self._buckets(signature))
+
+    async def find(self, description: str, exclude_job_id: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        """
+        Find the indexed job most similar to a description.
+
+        Args:
+            description: Job description to look up
+            exclude_job_id: Job to ignore, typically the job being looked up
+
+        Returns:
+            Optional[Tuple[str, float]]: (job ID, estimated similarity) of the best
+                match at or above the threshold, or None
+        """
+        signature = self.hasher.signature(shingles(description))
+        candidates = await self.repo.get_candidates(self._buckets(signature))
+        best = None
+        for job_id, candidate in candidates.items():
+            if job_id == exclude_job_id:
+                continue
+            similarity = estimate_similarity(signature, candidate)
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (job_id, similarity)
+        return best
@@ -0,0 +1,150 @@
+"""
+Deterministic, network-free stand-in for the LLM agents.
+
+Selected with LLM_PROVIDER = "offline". Outputs are schema-valid instances of
+the requested pydantic model, built from a seed derived from the prompt, so
+the same prompt always yields the same output. Useful for exercising the
+database, concurrency and caching paths without an API key.
+"""
+import asyncio
+import json
+import random
+import re
+import typing
+from typing import Any, List, Type
+
+from pydantic import BaseModel
+
+from app.hashing import content_hash
+from app.prompt_compaction import estimate_tokens
+
+# Model name reported for offline runs; also keeps offline cache keys apart
+OFFLINE_MODEL_NAME = "offline:deterministic"
+
+_SKILL_CATEGORIES = ["Core Technical", "Tools & Platforms", "Domain Expertise", "Methodologies", "Soft Skills"]
+
+_FALLBACK_WORDS = [
+    "python", "sql", "docker", "aws", "pipelines", "analytics", "latency",
+    "models", "services", "kubernetes", "testing", "platform", "data",
+]
+
+
+class OfflineUsage:
+    """Token usage of an offline run, shaped like pydantic-ai's Usage."""
+
+    def __init__(self, request_tokens: int, response_tokens: int):
+        self.requests = 1
+        self.request_tokens = request_tokens
+        self.response_tokens = response_tokens
+        self.total_tokens = request_tokens + response_tokens
+
+
+class OfflineRunResult:
+    """Result of an offline run, shaped like pydantic-ai's AgentRunResult."""
+
+    def __init__(self, output: BaseModel, usage: OfflineUsage):
+        self.output = output
+        self._usage = usage
+
+    def usage(self) -> OfflineUsage:
+        return self._usage
+
+
+class OfflineAgent:
+    """Drop-in replacement for a pydantic-ai Agent that never leaves the process."""
+
+    def __init__(self, output_type: Type[BaseModel], system_prompt: str = "",
+                 latency: float = 0.0):
+        self.output_type = output_type
+        self.system_prompt = system_prompt
+        self.latency = latency
+
+    async def run(self, user_prompt: Any) -> OfflineRunResult:
+        """Return a deterministic output for the prompt after the configured latency."""
+        if not isinstance(user_prompt, str):
+            user_prompt = json.dumps(user_prompt, sort_keys=True, default=str)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        output = build_offline_output(self.output_type, user_prompt)
+        usage = OfflineUsage(
+            request_tokens=estimate_tokens(self.system_prompt) + estimate_tokens(user_prompt),
+            response_tokens=estimate_tokens(output.model_dump_json())
+        )
+        return OfflineRunResult(output, usage)
+
+
+def build_offline_output(output_type: Type[BaseModel], prompt: str) -> BaseModel:
+    """Build a schema-valid instance of output_type seeded by the prompt."""
+    rng = random.Random(content_hash(output_type.__name__, prompt))
+    words = _prompt_words(prompt)
+    output = _fake_model(output_type, rng, words)
+
+    # A few fields carry meaning the pipeline relies on
+    if output_type.__name__ == "JobAnalysis":
+        output.job_description = prompt
+    if output_type.__name__ == "GeneratedSkills":
+        _name_skill_categories(output)
+    if output_type.__name__ == "GeneratedResume":
+        _name_skill_categories(output.skills)
+    return output
+
+
+def _name_skill_categories(skills: BaseModel) -> None:
+    for category, name in zip(skills.categories, _SKILL_CATEGORIES):
+        category.name = name
+
+
+def offline_search_queries(prompt: str, count: int = 3) -> str:
+    """Build the JSON search query list JobSearchAgent expects from the LLM."""
+    rng = random.Random(content_hash("search_queries", prompt))
+    words = _prompt_words(prompt)
+    queries = [{
+        "keywords": " ".join(rng.sample(words, min(2, len(words)))).title(),
+        "location": "Canada",
+        "job_type": ["Full-time"],
+        "experience_level": ["Mid-Senior level"],
+        "date_posted": "Past month",
+        "remote": bool(index % 2),
+        "explanation": f"Offline query {index + 1}",
+    } for index in range(count)]
+    return json.dumps(queries)
+
+
+def _prompt_words(prompt: str) -> List[str]:
+    """Distinct longer words of the prompt, used as the output vocabulary."""
+    words = sorted(set(re.findall(r"[A-Za-z][A-Za-z+#.-]{3,}", prompt)))
+    return words or _FALLBACK_WORDS
+
+
+def _fake_model(model: Type[BaseModel], rng: random.Random, words: List[str]) -> BaseModel:
+    values = {
+        name: _fake_value(field.annotation, name, rng, words)
+        for name, field in model.model_fields.items()
+    }
+    return model(**values)
+
+
+def _fake_value(annotation: Any, name: str, rng: random.Random, words: List[str]) -> Any:
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        # Optional[X] and friends: generate the first non-None member
+        members = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _fake_value(members[0], name, rng, words)
+    if origin in (list, List):
+        (item_type,) = typing.get_args(annotation)
+        items = [_fake_value(item_type, name, rng, words) for _ in range(rng.randint(2, 4))]
+        if item_type is not str and hasattr(item_type, "model_fields") and "display_order" in item_type.model_fields:
+            for index, item in enumerate(items):
+                item.display_order = index
+        return items
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _fake_model(annotation, rng, words)
+    if annotation is bool:
+        return rng.random() < 0.5
+    if annotation is int:
+        return rng.randint(50, 95) if name == "proficiency" else rng.randint(0, 10)
+    if annotation is float:
+        return round(rng.random(), 3)
+    length = 3 if name in ("name", "title", "degree", "company", "institution") else 12
+    return " ".join(rng.choice(words) for _ in range(length)).capitalize()
@@ -0,0 +1,131 @@
+"""Section-aware slicing of job descriptions to keep generator prompts small."""
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Characters per token used to estimate prompt size without a tokenizer
+CHARS_PER_TOKEN = 4
+
+# Heading phrases that open each kind of job description block. Scraped
+# descriptions usually lose their line breaks, so headings are recognised
+# by phrase rather than by layout.
+BLOCK_HEADINGS: Dict[str, List[str]] = {
+    "preferred": [
+        r"preferred qualifications", r"preferred skills", r"nice[- ]to[- ]haves?",
+        r"bonus points", r"bonus if you have", r"bonus", r"pluses", r"it'?s a plus if",
+    ],
+    "requirements": [
+        r"requirements", r"minimum qualifications", r"basic qualifications",
+        r"required qualifications", r"qualifications", r"what you'?ll bring",
+        r"what you bring", r"what we'?re looking for", r"who we'?re looking for",
+        r"who you are", r"about you", r"you might be a fit if", r"you have",
+        r"must haves?", r"skills (?:and|&) experience", r"required skills",
+    ],
+    "responsibilities": [
+        r"what you'?ll do", r"what you will do", r"key responsibilities",
+        r"main responsibilities", r"responsibilities", r"your role", r"in this role,? you will",
+        r"day[- ]to[- ]day", r"about the role", r"the role", r"the opportunity",
+    ],
+    "benefits": [
+        r"benefits", r"perks", r"what we offer", r"why join us", r"compensation",
+        r"salary", r"pay range",
+    ],
+    "about": [
+        r"about us", r"about the company", r"about the job", r"who we are",
+        r"our mission", r"overview",
+    ],
+}
+
+# Block categories each section prompt needs, most important first
+SECTION_BLOCKS: Dict[str, List[str]] = {
+    "summary": ["responsibilities", "requirements", "about"],
+    "skills": ["requirements", "preferred"],
+    "experience": ["responsibilities", "requirements"],
+    "projects": ["requirements", "preferred", "responsibilities"],
+    "education": ["requirements"],
+    # Single-call generation of every section
+    "compact": ["requirements", "responsibilities", "preferred", "about"],
+}
+
+_HEADING_PATTERN = re.compile(
+    # A heading starts the text, follows a line break or sentence end, or is
+    # glued to the previous word when scraping dropped the line break ...
+    r"(?:^|(?<=[\n.!?:;)a-z])|(?<=[.!?]\s))\s*"
+    r"(?P<heading>" + "|".join(
+        f"(?P<{category}>{'|'.join(patterns)})"
+        for category, patterns in BLOCK_HEADINGS.items()
+    ) + r")"
+    # ... and is followed by a colon, a line break or a capitalised word
+    r"(?=\s*:|\s*\n|\s*(?-i:[A-Z]))",
+    re.IGNORECASE
+)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s*(?=[A-Z])")
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the number of tokens in a piece of text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_blocks(description: str) -> List[Tuple[str, str]]:
+    """
+    Split a job description into (category, text) blocks at known headings.
+
+    Text before the first heading is treated as an "about" block.
+    """
+    blocks = []
+    category, start = "about", 0
+    for match in _HEADING_PATTERN.finditer(description):
+        # Headings are capitalised; this rejects matches inside running text
+        if not match.group("heading")[0].isupper():
+            continue
+        if match.start("heading") > start:
+            blocks.append((category, description[start:match.start("heading")].strip()))
+        category = next(name for name in BLOCK_HEADINGS if match.group(name))
+        start = match.start("heading")
+    blocks.append((category, description[start:].strip()))
+    return [(category, text) for category, text in blocks if text]
+
+
+def truncate_to_budget(text: str, max_tokens: int) -> str:
+    """Cut text to roughly max_tokens, preferring a sentence boundary."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+
+    kept = ""
+    for sentence in _SENTENCE_END.split(text):
+        if len(kept) + len(sentence) + 1 > max_chars:
+            break
+        kept = f"{kept} {sentence}" if kept else sentence
+    # Fall back to a hard cut when even the first sentence is over budget
+    return kept or text[:max_chars]
+
+
+def compact_job_description(description: str, section: str,
+                            max_tokens: Optional[int] = None) -> str:
+    """
+    Build the trimmed view of a job description used by one section prompt.
+
+    Blocks relevant to the section are picked in priority order until
+    max_tokens is used up, then returned in their original order. If the
+    description has no recognisable relevant blocks, its beginning is used.
+    """
+    if max_tokens is None or estimate_tokens(description) <= max_tokens:
+        return description
+
+    blocks = split_blocks(description)
+    wanted = SECTION_BLOCKS.get(section, [])
+    selected: Dict[int, str] = {}
+    remaining = max_tokens
+    for category in wanted:
+        for index, (block_category, text) in enumerate(blocks):
+            if block_category != category or remaining <= 0:
+                continue
+            text = truncate_to_budget(text, remaining)
+            selected[index] = text
+            remaining -= estimate_tokens(text)
+
+    if not selected:
+        return truncate_to_budget(description, max_tokens)
+    return "\n\n".join(selected[index] for index in sorted(selected))
@@ -0,0 +1,71 @@
+"""
+In-process single-flight coalescing of identical concurrent calls.
+
+The first caller for a key starts the call; callers arriving while it is in
+flight await the same task instead of repeating the work (an LLM request,
+a database write). The key is released once the call finishes, so later
+callers start afresh and go through the usual caches.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """An in-flight call and the number of callers awaiting it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution."""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Run call, or await the identical call already in flight for key."""
+        result, _ = await self.do_shared(key, call)
+        return result
+
+    async def do_shared(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Like do, also reporting whether the result came from another caller's call.
+
+        Returns:
+            Tuple[T, bool]: The result, and True if this caller joined a call
+                started by someone else
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            # The task copies the caller's context, so instrumentation inside
+            # the call is attributed to the caller that started it
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._release(key, flight))
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            # Shielded so one caller being cancelled does not fail the others
+            return await asyncio.shield(flight.task), shared
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Nobody else is waiting for the result
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _release(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled():
+            # Retrieve the exception so an unawaited failure is not logged
+            flight.task.exception()
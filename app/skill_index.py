@@ -0,0 +1,235 @@
+"""
+Normalized skill index linking job requirements to the candidate's skills.
+
+The analyzer's free-text required_skills is split into canonical skill names
+tagged required or preferred (job_skills), and the parsed background's
+skills_list into candidate_skills. Both share canonical_skills, so coverage
+questions such as "which saved jobs need Kubernetes that I lack" are plain
+SQL instead of new LLM calls.
+"""
+import re
+from typing import Dict, List, Optional
+
+from app.config import PREFERRED_SKILL_WEIGHT
+from app.db.skill_repository import SkillRepository
+from app.models import SkillMatch
+
+# Spellings folded into one canonical name
+SKILL_ALIASES = {
+    "k8s": "kubernetes",
+    "js": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "react.js": "react",
+    "reactjs": "react",
+    "amazon web services": "aws",
+    "google cloud platform": "gcp",
+    "google cloud": "gcp",
+    "microsoft azure": "azure",
+    "ml": "machine learning",
+    "nlp": "natural language processing",
+    "cicd": "ci/cd",
+    "scikit learn": "scikit-learn",
+    "sklearn": "scikit-learn",
+}
+
+# Longest phrase (in words) kept as a skill; longer pieces are prose, not skill names
+MAX_SKILL_WORDS = 4
+
+_TAG = re.compile(r"\[(required|preferred)\]", re.IGNORECASE)
+_PREFERRED_HEADING = re.compile(
+    r"^(preferred|nice[- ]to[- ]have|bonus|optional|plus(es)?|desired)\b[^:]*:\s*", re.IGNORECASE
+)
+_REQUIRED_HEADING = re.compile(
+    r"^(required|must[- ]have|requirements?|mandatory|essential)\b[^:]*:\s*", re.IGNORECASE
+)
+_LABEL = re.compile(r"^[\w &/-]{1,30}:\s*")
+_FILLER = re.compile(
+    r"^(\d+\+?\s*(years?|yrs?)\s*(of\s+)?(experience\s+)?(with|in|using)?\s*"
+    r"|(strong|solid|deep|proven|hands-on|working|good|excellent)\s+"
+    r"|(experience|proficiency|expertise|familiarity|knowledge|understanding)\s+(with|in|of)\s+"
+    r"|(ability|able)\s+to\s+)+",
+    re.IGNORECASE
+)
+# Boundaries between groups of comma-separated skills: list separators, and
+# sentence ends including those right after a tag ("Python [REQUIRED]. Go")
+_GROUPS = re.compile(r"[;\n•·|]|\s-\s|(?<=[A-Za-z0-9)\]])\.\s")
+_COMMAS = re.compile(r",")
+_BULLET = re.compile(r"^(?:[-*•·▪◦‣]|\d+[.)])\s+")
+_PARENTHESES = re.compile(r"\(([^)]*)\)")
+_ASIDE_LEAD = re.compile(r"^(?:e\.g\.|i\.e\.|such as|including|incl\.|like)\s*", re.IGNORECASE)
+_CONJUNCTIONS = re.compile(r"\s+(?:and|or|&)\s+", re.IGNORECASE)
+
+
+def normalize_skill(name: str) -> str:
+    """Canonical form of a skill name: lowercase, single-spaced, aliases folded."""
+    name = re.sub(r"\s+", " ", name.strip().lower())
+    name = name.strip(" .:-*\"'")
+    return SKILL_ALIASES.get(name, name)
+
+
+def _split_outside_parentheses(pattern: re.Pattern, text: str) -> List[str]:
+    """Split text at the matches of pattern that are not inside parentheses."""
+    pieces = []
+    start = scanned = depth = 0
+    for match in pattern.finditer(text):
+        for char in text[scanned:match.start()]:
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth = max(depth - 1, 0)
+        scanned = match.start()
+        if depth == 0:
+            pieces.append(text[start:match.start()])
+            start = match.end()
+    pieces.append(text[start:])
+    return pieces
+
+
+def _piece_skills(piece: str) -> List[str]:
+    piece = _LABEL.sub("", piece.strip())
+    piece = _FILLER.sub("", piece.strip())
+    skills = []
+    for part in _CONJUNCTIONS.split(piece):
+        skill = normalize_skill(part)
+        # Bare numbers are list numbering ("1. Python" splits at the period)
+        if skill and not skill.isdigit() and len(skill.split()) <= MAX_SKILL_WORDS:
+            skills.append(skill)
+    return skills
+
+
+def _clean_piece(piece: str) -> List[str]:
+    piece = _TAG.sub(" ", piece)
+    skills = _piece_skills(_PARENTHESES.sub(" ", piece))
+    # Items of an aside such as "(AWS, GCP)" are skills of their own
+    for aside in _PARENTHESES.findall(piece):
+        for item in re.split(r"[,;]", aside):
+            skills.extend(_piece_skills(_ASIDE_LEAD.sub("", item.strip())))
+    return skills
+
+
+def extract_job_skills(required_skills: Optional[str]) -> Dict[str, str]:
+    """
+    Split the analyzer's required_skills text into tagged canonical skills.
+
+    The text is split into groups (sentences, lines, list items, with any
+    leading bullet marker dropped) and each group into comma-separated
+    pieces. Separators inside a parenthesised aside do not split it: the
+    items of "Cloud platforms (AWS, GCP)" are indexed next to the piece
+    itself, with the same tag. A [REQUIRED] / [PREFERRED] tag labels the
+    run of untagged pieces it closes ("Docker, Kubernetes [PREFERRED]"),
+    and a tag or a heading ("Preferred:", "Nice to have:") at the start of
+    a group applies to the pieces after it. Untagged skills count as
+    required.
+
+    Returns:
+        Dict[str, str]: Canonical skill name -> 'required' or 'preferred';
+            required wins when a skill appears as both
+    """
+    skills: Dict[str, str] = {}
+
+    def add(piece: str, requirement: str) -> None:
+        for skill in _clean_piece(piece):
+            if skills.get(skill) != "required":
+                skills[skill] = requirement
+
+    mode = "required"
+    for group in _split_outside_parentheses(_GROUPS, required_skills or ""):
+        group = _BULLET.sub("", group.strip())
+        tag = _TAG.match(group)
+        if tag:
+            mode = tag.group(1).lower()
+            group = group[tag.end():]
+        elif _PREFERRED_HEADING.match(group):
+            mode = "preferred"
+            group = _PREFERRED_HEADING.sub("", group)
+        elif _REQUIRED_HEADING.match(group):
+            mode = "required"
+            group = _REQUIRED_HEADING.sub("", group)
+
+        run: List[str] = []
+        for piece in _split_outside_parentheses(_COMMAS, group):
+            if not piece.strip():
+                continue
+            run.append(piece)
+            tag = _TAG.search(piece)
+            if tag:
+                # The tag labels every untagged piece since the previous tag
+                for tagged in run:
+                    add(tagged, tag.group(1).lower())
+                run = []
+        for piece in run:
+            add(piece, mode)
+    return skills
+
+
+def match_skills(job_id: str, job_skills: Dict[str, str], candidate_skills: List[str],
+                 preferred_weight: float = PREFERRED_SKILL_WEIGHT) -> SkillMatch:
+    """Score how a candidate's skills cover a job's required and preferred skills."""
+    have = set(candidate_skills)
+    required = {skill for skill, requirement in job_skills.items() if requirement == "required"}
+    preferred = set(job_skills) - required
+
+    total = len(required) + preferred_weight * len(preferred)
+    matched = len(required & have) + preferred_weight * len(preferred & have)
+    return SkillMatch(
+        job_id=job_id,
+        score=matched / total if total else 0.0,
+        matched_required=sorted(required & have),
+        missing_required=sorted(required - have),
+        matched_preferred=sorted(preferred & have),
+        missing_preferred=sorted(preferred - have),
+    )
+
+
+class SkillIndex:
+    """Maintains and queries the job_skills / candidate_skills index."""
+
+    def __init__(self, db_path: str, preferred_weight: float = PREFERRED_SKILL_WEIGHT):
+        self.repo = SkillRepository(db_path)
+        self.preferred_weight = preferred_weight
+
+    async def index_job(self, job_id: str, required_skills: Optional[str]) -> Dict[str, str]:
+        """Replace a job's skill rows with those extracted from its analysis."""
+        skills = extract_job_skills(required_skills)
+        await self.repo.set_job_skills(job_id, skills)
+        return skills
+
+    async def reindex_jobs(self) -> int:
+        """Rebuild the skill rows of every analyzed job from its latest analysis."""
+        analyzed = await self.repo.get_analyzed_jobs()
+        for job_id, required_skills in analyzed.items():
+            await self.index_job(job_id, required_skills)
+        return len(analyzed)
+
+    async def index_candidate(self, background_hash: str, skills_list: List[str]) -> List[str]:
+        """Replace a parsed background's skill rows."""
+        skills = sorted({normalize_skill(skill) for skill in skills_list} - {""})
+        await self.repo.set_candidate_skills(background_hash, skills)
+        return skills
+
+    async def match(self, job_id: str, background_hash: str) -> SkillMatch:
+        """Matched and missing skills of a background for one job."""
+        return match_skills(
+            job_id,
+            await self.repo.get_job_skills(job_id),
+            await self.repo.get_candidate_skills(background_hash),
+            self.preferred_weight
+        )
+
+    async def jobs_missing(self, skill: str, background_hash: str) -> List[Dict]:
+        """Saved jobs asking for a skill the background lacks."""
+        return await self.repo.get_jobs_missing_skill(normalize_skill(skill), background_hash)
+
+    async def rank_jobs(self, background_hash: str) -> List[Dict]:
+        """Every indexed job with its skill match score for a background, best first."""
+        rows = await self.repo.get_match_counts(background_hash)
+        for row in rows:
+            total = row['required_total'] + self.preferred_weight * row['preferred_total']
+            matched = row['required_matched'] + self.preferred_weight * row['preferred_matched']
+            row['score'] = matched / total if total else 0.0
+        return sorted(rows, key=lambda row: row['score'], reverse=True)
@@ -0,0 +1,106 @@
+"""
+Compare SQLite reads and writes per second in the "default" and "wal" storage modes.
+
+Each of N threads stands in for one resume build: it creates a resume,
+stores its sections one transaction at a time as a streamed build does, and
+reads the resume's status and rows back between writes. Every thread works
+against the same database file, as concurrent builds do.
+
+Usage:
+    python benchmarks/db_concurrency.py [--builds N] [--seconds S]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SECTIONS = {
+    "summary": "Data engineer with eight years of pipeline experience.",
+    "skills": [
+        {"name": category, "skills": [{"name": f"{category} skill {index}"} for index in range(10)]}
+        for category in ("Languages", "Data", "Cloud", "Tools")
+    ],
+    "experience": [
+        {"job_title": f"Engineer {index}", "company": f"Company {index}",
+         "accomplishments": [f"Accomplishment {line}" for line in range(5)]}
+        for index in range(3)
+    ],
+    "education": [{"degree": "BSc Computer Science", "institution": "University"}],
+    "projects": [{"title": f"Project {index}", "description": "A project"} for index in range(3)],
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--builds", type=int, default=8, help="Concurrent resume builds")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration per mode")
+    return parser.parse_args()
+
+
+def run_mode(mode: str, builds: int, seconds: float) -> dict:
+    from app.db.connection import get_connection_manager
+    from app.db.repository import ResumeRepository
+
+    db_path = os.path.join(tempfile.mkdtemp(), "benchmark.sqlite")
+    get_connection_manager(db_path, storage_mode=mode)
+    counts = {"reads": 0, "writes": 0, "locked": 0}
+    counts_lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def build() -> None:
+        repo = ResumeRepository(db_path)
+        reads = writes = locked = 0
+        while time.perf_counter() < deadline:
+            try:
+                resume_id = repo.create_resume("Benchmark", None)
+                writes += 1
+                for section, data in SECTIONS.items():
+                    repo.save_sections(resume_id, {section: data}, replace=True)
+                    writes += 1
+                    repo.get_section_statuses(resume_id)
+                    repo.get_resume(resume_id)
+                    reads += 2
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e):
+                    raise
+                locked += 1
+        repo.close()
+        with counts_lock:
+            counts["reads"] += reads
+            counts["writes"] += writes
+            counts["locked"] += locked
+
+    threads = [threading.Thread(target=build) for _ in range(builds)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "mode": mode,
+        "reads_per_s": counts["reads"] / elapsed,
+        "writes_per_s": counts["writes"] / elapsed,
+        "locked": counts["locked"],
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    rows = [run_mode(mode, args.builds, args.seconds) for mode in ("default", "wal")]
+
+    print(f"{args.builds} concurrent resume builds, {args.seconds}s per mode\n")
+    print(f"{'mode':<8} {'reads/s':>9} {'writes/s':>9} {'locked errors':>14}")
+    for row in rows:
+        print(f"{row['mode']:<8} {row['reads_per_s']:>9.0f} {row['writes_per_s']:>9.0f} {row['locked']:>14}")
+    print("\nA write is one committed transaction: a resume row or one stored section.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compare the "per-section" and "compact" generation modes on latency and tokens.
+
+Runs entirely on the offline provider (no API key needed) with a simulated
+per-call latency, and with the LLM cache disabled so every call is paid for.
+
+Usage:
+    python benchmarks/generation_modes.py [--resumes N] [--latency SECONDS]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=5, help="Resumes generated per mode")
+    parser.add_argument("--latency", type=float, default=0.5,
+                        help="Simulated seconds per LLM round trip")
+    return parser.parse_args()
+
+
+async def run_mode(mode: str, resumes: int, my_background: str, job_description: str) -> dict:
+    from app.ai_resume_builder import AIResumeBuilder
+    from app.db.job_repository import JobRepository
+    from app.models import Job
+
+    db_path = os.path.join(tempfile.mkdtemp(), "benchmark.sqlite")
+    # Postings differ only by a suffix; near-duplicate reuse would skip their generation
+    builder = AIResumeBuilder(db_path, provider="offline", use_llm_cache=False, detect_duplicates=False)
+    jobs = [
+        Job(id=f"{mode}-{index}", title=f"Data Engineer {index}", company=f"Company {index}",
+            description=f"{job_description}\n\nPosting {index}", scraped_date=datetime.now())
+        for index in range(resumes)
+    ]
+    for job in jobs:
+        await JobRepository(db_path).create(job)
+
+    async for result in builder.create_resumes(jobs, my_background, generation_mode=mode):
+        if result.error:
+            print(f"{mode}: {result.job_id} failed: {result.error}")
+
+    report = builder.batch_report()
+    generation = [stage for stage in report.stages if stage.stage.startswith("generate_")]
+    return {
+        "mode": mode,
+        "p50_total_ms": report.p50_total_ms,
+        "p95_total_ms": report.p95_total_ms,
+        "llm_calls": sum(stage.count for stage in generation) // max(resumes, 1),
+        "request_tokens": sum(stage.request_tokens for stage in generation) // max(resumes, 1),
+        "response_tokens": sum(stage.response_tokens for stage in generation) // max(resumes, 1),
+    }
+
+
+async def main() -> None:
+    args = parse_args()
+    # Read by app.config at import time, so set it before importing the app
+    os.environ["RESUME_BUILDER_OFFLINE_LATENCY"] = str(args.latency)
+
+    test_data = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_data")
+    with open(os.path.join(test_data, "background.txt"), "r") as f:
+        my_background = f.read()
+    with open(os.path.join(test_data, "job_description.txt"), "r") as f:
+        job_description = f.read()
+
+    rows = [await run_mode(mode, args.resumes, my_background, job_description)
+            for mode in ("per-section", "compact")]
+
+    print(f"{args.resumes} resumes per mode, {args.latency}s simulated latency per call\n")
+    print(f"{'mode':<12} {'p50 ms':>9} {'p95 ms':>9} {'calls':>6} {'req tok':>8} {'resp tok':>9}")
+    for row in rows:
+        print(f"{row['mode']:<12} {row['p50_total_ms']:>9.0f} {row['p95_total_ms']:>9.0f} "
+              f"{row['llm_calls']:>6} {row['request_tokens']:>8} {row['response_tokens']:>9}")
+    print("\nTokens and calls are per resume, generation stages only.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""
+Check the import time of the CLI entry points against a budget.
+
+Each module is imported in a fresh interpreter several times and the median
+wall time is compared with its budget. Heavy libraries (pydantic-ai, openai,
+pandas, numpy) must not be pulled in at import time at all; they are loaded on the
+code paths that need them.
+
+Usage:
+    python benchmarks/import_time.py [--runs N]
+
+Exits with status 1 if any module is over budget or imports a heavy library.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Median import time budget per module, in milliseconds
+IMPORT_BUDGETS_MS = {
+    "app.db.job_repository": 100,
+    "app.ai_resume_builder": 200,
+    "app.job_search_agent": 200,
+    "main": 200,
+}
+
+# Libraries that must only be imported on first use
+DEFERRED_MODULES = ("pydantic_ai", "openai", "pandas", "numpy")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "loaded": [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str, runs: int) -> dict:
+    """Median import time of module over runs fresh interpreters."""
+    probe = _PROBE.format(module=module, deferred=DEFERRED_MODULES)
+    timings = []
+    loaded = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", probe], cwd=ROOT, check=True,
+            capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["ms"])
+        loaded = result["loaded"]
+    return {"module": module, "median_ms": statistics.median(timings), "loaded": loaded}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check CLI import time against a budget")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<24} {'median ms':>10} {'budget ms':>10}  heavy imports")
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        result = measure(module, args.runs)
+        over = result["median_ms"] > budget or result["loaded"]
+        failed = failed or over
+        print(f"{module:<24} {result['median_ms']:>10.1f} {budget:>10}  "
+              f"{', '.join(result['loaded']) or '-'}{'  <-- over budget' if over else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
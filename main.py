@@ -5,10 +5,10 @@ import os
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
-import openai
 from app.ai_resume_builder import AIResumeBuilder
-from app.config import DATABASE_PATH
-from app.models import Company, Job
+from app.config import DATABASE_PATH, JOB_MIN_RELEVANCE_SCORE, LLM_PROVIDER
+from app.job_ranking import rank_jobs
+from app.models import Job
 from app.db.job_repository import JobRepository
 
 def get_latest_jobs_file(input_dir: str = "input") -> Path:
@@ -22,8 +22,8 @@ async def main():
     # Load environment variables
     load_dotenv()
     
-    # Check if OPENAI_API_KEY is set
-    if not os.getenv('OPENAI_API_KEY'):
+    # Check if OPENAI_API_KEY is set (the offline provider does not need one)
+    if LLM_PROVIDER == "openai" and not os.getenv('OPENAI_API_KEY'):
         print("Error: OPENAI_API_KEY environment variable is not set.")
         print("Please make sure your .env file contains a valid API key.")
         return
@@ -94,8 +94,8 @@ async def main():
         print(f"Error: Could not find background file at {background_path}")
         return
 
-    # Process each job description
-    resume_ids = []
+    # Collect the jobs to process
+    jobs = []
     for job_data in jobs_data['jobs']:
         # Skip incomplete job entries or non-mid-senior level positions
         if not all(key in job_data for key in ['id', 'title', 'company', 'description']):
@@ -109,7 +109,7 @@ async def main():
             continue
 
         # Create Job model
-        job = Job(
+        jobs.append(Job(
             id=job_data['id'],
             title=job_data['title'],
             company=job_data['company'],
@@ -119,38 +119,42 @@ async def main():
             application_url=job_data.get('application_url', ''),
             applied=False,
             scraped_date=datetime.now()
-        )
+        ))
 
-        # Store job in database if it doesn't exist
-        job_added = await job_repo.create(job)
-        if job_added:
-            print(f"\nAdded new job: {job.title} at {job.company}")
-        else:
-            print(f"\nJob already exists: {job.title} at {job.company}")
-            
-        # Create company with job details including application URL
-        company = Company(
-            name=job.company,
-            job_title=job.title,
-            job_description=job.description,
-            location=job.location,
-            application_url=job.application_url,
-            seniority_level=job.seniority_level
-        )
-        company_id = await builder.analyze_job_description_with_company(company)
-        
-        print(f"Creating targeted resume for job {job.id}...")
-        resume_id = await builder.create_resume(company_id, my_background, job.id)
+    # Rank jobs locally against the background so the LLM budget goes to the
+    # best matches first, dropping those below the relevance cutoff
+    ranked_jobs = rank_jobs(jobs, my_background, min_score=JOB_MIN_RELEVANCE_SCORE)
+    print("\nJobs by relevance to your background:")
+    for job, score in ranked_jobs:
+        print(f"  {score:.3f}  {job.title} at {job.company}")
+    if len(ranked_jobs) < len(jobs):
+        print(f"Skipping {len(jobs) - len(ranked_jobs)} jobs scoring below {JOB_MIN_RELEVANCE_SCORE}")
+    jobs = [job for job, _ in ranked_jobs]
+
+    # Store, analyze and build resumes for all jobs concurrently
+    print(f"\nCreating targeted resumes for {len(jobs)} jobs...")
+    jobs_by_id = {job.id: job for job in jobs}
+    resume_ids = []
+    failed_jobs = []
+    async for result in builder.create_resumes(jobs, my_background):
+        job = jobs_by_id[result.job_id]
+        if result.error:
+            print(f"Failed to create resume for job {job.id} ({job.title} at {job.company}): {result.error}")
+            failed_jobs.append(job)
+            continue
         resume_ids.append({
             "job_id": job.id,
-            "resume_id": resume_id,
+            "resume_id": result.resume_id,
             "company": job.company,
             "title": job.title,
             "application_url": job.application_url
         })
-        print(f"Resume created successfully for job {job.id}! Resume ID: {resume_id}")
+        print(f"Resume created successfully for job {job.id}! Resume ID: {result.resume_id}")
 
-    print("\nAll resumes created successfully!")
+    if failed_jobs:
+        print(f"\nCreated {len(resume_ids)} resumes, {len(failed_jobs)} jobs failed.")
+    else:
+        print("\nAll resumes created successfully!")
     print("\nResume Details:")
     for resume in resume_ids:
         print(f"Job {resume['job_id']} at {resume['company']}")
@@ -159,5 +163,17 @@ async def main():
         print(f"Application URL: {resume['application_url']}")
         print("-" * 50)
 
+    batch_report = builder.batch_report(job.id for job in jobs)
+    if batch_report.resumes:
+        print("\nStage timings (slowest first):")
+        for stage in batch_report.stages:
+            print(f"  {stage.stage:<22} p50 {stage.p50_ms:8.0f} ms  p95 {stage.p95_ms:8.0f} ms  "
+                  f"tokens {stage.request_tokens}/{stage.response_tokens}  retries {stage.retries}")
+        print(f"  {'total per job':<22} p50 {batch_report.p50_total_ms:8.0f} ms  p95 {batch_report.p95_total_ms:8.0f} ms")
+
+    if builder.llm_cache is not None:
+        await builder.llm_cache.close()
+        print(f"LLM cache: {builder.llm_cache.stats()}")
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,44 @@
+import asyncio
+from datetime import datetime
+
+from app.ai_resume_builder import AIResumeBuilder
+from app.models import Job
+
+BACKGROUND = "Data engineer with eight years of Python, SQL and Airflow pipeline experience."
+
+DESCRIPTION = (
+    "We are looking for a senior data engineer to design, build and operate batch and "
+    "streaming pipelines on our cloud data platform. You will own ingestion from dozens "
+    "of sources, model warehouse tables for analysts, tune Spark jobs and keep data "
+    "quality checks green. Required skills: Python, SQL, Spark, Airflow [REQUIRED]. "
+    "Nice to have: Kafka, dbt [PREFERRED]."
+)
+
+
+def _jobs():
+    return [
+        Job(id="0", title="Senior Data Engineer", company="Acme", description=DESCRIPTION,
+            scraped_date=datetime(2025, 1, 1)),
+        Job(id="1", title="Senior Data Engineer", company="Acme", description=DESCRIPTION + " Remote.",
+            scraped_date=datetime(2025, 1, 2)),
+    ]
+
+
+async def _run_batch(db_path, detect_duplicates):
+    builder = AIResumeBuilder(str(db_path), provider="offline", use_llm_cache=False,
+                              detect_duplicates=detect_duplicates)
+    return {result.job_id: result async for result in builder.create_resumes(_jobs(), BACKGROUND)}
+
+
+def test_rerun_keeps_each_jobs_own_resume(tmp_path):
+    db_path = tmp_path / "resumes.sqlite"
+    first = asyncio.run(_run_batch(db_path, detect_duplicates=False))
+    assert first["0"].resume_id != first["1"].resume_id
+
+    for _ in range(2):
+        rerun = asyncio.run(_run_batch(db_path, detect_duplicates=True))
+        for job_id, result in first.items():
+            assert rerun[job_id].error is None
+            assert rerun[job_id].duplicate_of is None
+            assert rerun[job_id].company_id == result.company_id
+            assert rerun[job_id].resume_id == result.resume_id
@@ -0,0 +1,32 @@
+from app.skill_index import extract_job_skills
+
+
+def test_items_inside_parentheses_are_skills_with_the_same_tag():
+    assert extract_job_skills("Cloud platforms (AWS, GCP, Azure) [REQUIRED]") == {
+        "cloud platforms": "required",
+        "aws": "required",
+        "gcp": "required",
+        "azure": "required",
+    }
+
+
+def test_bullet_markers_do_not_hide_a_skill():
+    assert extract_job_skills("- 3+ years of experience with PyTorch [REQUIRED]\n* Docker [PREFERRED]") == {
+        "pytorch": "required",
+        "docker": "preferred",
+    }
+
+
+def test_trailing_tag_labels_the_comma_group_it_closes():
+    assert extract_job_skills("Docker, Kubernetes [PREFERRED]") == {
+        "docker": "preferred",
+        "kubernetes": "preferred",
+    }
+
+
+def test_sentence_ending_in_a_tag_is_a_boundary():
+    assert extract_job_skills("Python [REQUIRED]. Nice to have: Go, Rust") == {
+        "python": "required",
+        "go": "preferred",
+        "rust": "preferred",
+    }